@@ -19,9 +19,46 @@ Usage:
     ticker = trader.get_ticker("BTC-PERPETUAL")
 """
 
-from .deribit_auth import DeribitAuth
-from .deribit_trader import DeribitTrader
-from .deribit_logger import DeribitLogger
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .deribit_auth import DeribitAuth
+    from .deribit_trader import DeribitTrader
+    from .deribit_async_trader import AsyncDeribitTrader
+    from .deribit_logger import DeribitLogger, BinaryDeribitLogger
+    from .deribit_ws import DeribitWSAuth
 
 __version__ = "1.1.0"
-__all__ = ["DeribitAuth", "DeribitTrader", "DeribitLogger"]
+__all__ = [
+    "DeribitAuth",
+    "DeribitTrader",
+    "AsyncDeribitTrader",
+    "DeribitLogger",
+    "BinaryDeribitLogger",
+    "DeribitWSAuth",
+]
+
+# Public names are imported on first access (PEP 562) so that
+# `import deribit` does not pull in `requests` until it is needed.
+_LAZY_EXPORTS = {
+    "DeribitAuth": ".deribit_auth",
+    "DeribitTrader": ".deribit_trader",
+    "AsyncDeribitTrader": ".deribit_async_trader",
+    "DeribitLogger": ".deribit_logger",
+    "BinaryDeribitLogger": ".deribit_logger",
+    "DeribitWSAuth": ".deribit_ws",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -1,8 +1,10 @@
+import sys
 import time
 import hmac
 import hashlib
 import random
 import string
+from urllib.parse import urlencode
 
 # Placeholder credentials for demonstration
 # Replace with your actual credentials when testing
@@ -10,27 +12,30 @@ CLIENT_ID = "YOUR_CLIENT_ID"
 CLIENT_SECRET = "YOUR_CLIENT_SECRET"
 BASE_URL = "https://test.deribit.com"
 
-print("=" * 70)
-print("Deribit Authentication Process Demonstration")
-print("=" * 70)
-print()
-print("NOTE: This is a demonstration showing how authentication works.")
-print("      Credentials shown are placeholders.")
-print()
-print("To test with real credentials:")
-print("  1. Set up credentials.json (see credentials.json.template)")
-print("  2. Run: python test_with_credentials.py")
-print()
-print("=" * 70)
-print()
+# Output is collected here and written once at the end
+_out = []
+
+_out.append("=" * 70)
+_out.append("Deribit Authentication Process Demonstration")
+_out.append("=" * 70)
+_out.append("")
+_out.append("NOTE: This is a demonstration showing how authentication works.")
+_out.append("      Credentials shown are placeholders.")
+_out.append("")
+_out.append("To test with real credentials:")
+_out.append("  1. Set up credentials.json (see credentials.json.template)")
+_out.append("  2. Run: python test_with_credentials.py")
+_out.append("")
+_out.append("=" * 70)
+_out.append("")
 
 # ============================================================================
 # METHOD 1: Client Credentials Authentication
 # ============================================================================
-print("METHOD 1: Client Credentials Authentication")
-print("-" * 70)
-print("This is the simplest authentication method.")
-print()
+_out.append("METHOD 1: Client Credentials Authentication")
+_out.append("-" * 70)
+_out.append("This is the simplest authentication method.")
+_out.append("")
 
 # Build the URL
 url = f"{BASE_URL}/api/v2/public/auth"
@@ -41,24 +46,24 @@ params = {
     "scope": "trade:read_write session:demo"
 }
 
-print("Request URL:")
-print(f"  {url}")
-print()
-print("Request Parameters:")
+_out.append("Request URL:")
+_out.append(f"  {url}")
+_out.append("")
+_out.append("Request Parameters:")
 for key, value in params.items():
     if key == "client_secret":
-        print(f"  {key}: {value[:10]}...{value[-10:]}")  # Hide middle part
+        _out.append(f"  {key}: {value[:10]}...{value[-10:]}")  # Hide middle part
     else:
-        print(f"  {key}: {value}")
-print()
+        _out.append(f"  {key}: {value}")
+_out.append("")
 
-print("Full Request (for testing):")
-param_str = "&".join([f"{k}={v}" for k, v in params.items()])
-print(f"  GET {url}?{param_str}")
-print()
+_out.append("Full Request (for testing):")
+param_str = urlencode(params)
+_out.append(f"  GET {url}?{param_str}")
+_out.append("")
 
-print("Expected Response:")
-print("""  {
+_out.append("Expected Response:")
+_out.append("""  {
     "jsonrpc": "2.0",
     "id": 1,
     "result": {
@@ -69,19 +74,19 @@ print("""  {
       "token_type": "bearer"
     }
   }""")
-print()
+_out.append("")
 
 # ============================================================================
 # METHOD 2: Client Signature Authentication
 # ============================================================================
-print("\n" + "=" * 70)
-print("METHOD 2: Client Signature Authentication (More Secure)")
-print("-" * 70)
-print("This method uses HMAC-SHA256 signature instead of sending the secret.")
-print()
+_out.append("\n" + "=" * 70)
+_out.append("METHOD 2: Client Signature Authentication (More Secure)")
+_out.append("-" * 70)
+_out.append("This method uses HMAC-SHA256 signature instead of sending the secret.")
+_out.append("")
 
 # Generate signature components
-timestamp = int(time.time() * 1000)  # Current time in milliseconds
+timestamp = time.time_ns() // 1_000_000  # Current time in milliseconds
 nonce = ''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(8))
 data = ""
 
@@ -93,20 +98,20 @@ signature = hmac.new(
     hashlib.sha256
 ).hexdigest()
 
-print("Signature Components:")
-print(f"  Timestamp: {timestamp} (current time in ms)")
-print(f"  Nonce: {nonce} (random 8-char string)")
-print(f"  Data: '{data}' (optional field)")
-print()
+_out.append("Signature Components:")
+_out.append(f"  Timestamp: {timestamp} (current time in ms)")
+_out.append(f"  Nonce: {nonce} (random 8-char string)")
+_out.append(f"  Data: '{data}' (optional field)")
+_out.append("")
 
-print("String to Sign (format: Timestamp\\nNonce\\nData):")
-print(f"  '{timestamp}\\n{nonce}\\n{data}'")
-print()
+_out.append("String to Sign (format: Timestamp\\nNonce\\nData):")
+_out.append(f"  '{timestamp}\\n{nonce}\\n{data}'")
+_out.append("")
 
-print("Signature Calculation:")
-print(f"  HMAC-SHA256(ClientSecret, StringToSign)")
-print(f"  Signature: {signature}")
-print()
+_out.append("Signature Calculation:")
+_out.append(f"  HMAC-SHA256(ClientSecret, StringToSign)")
+_out.append(f"  Signature: {signature}")
+_out.append("")
 
 params_sig = {
     "grant_type": "client_signature",
@@ -118,80 +123,80 @@ params_sig = {
     "scope": "trade:read_write session:signature_demo"
 }
 
-print("Request Parameters:")
+_out.append("Request Parameters:")
 for key, value in params_sig.items():
-    print(f"  {key}: {value}")
-print()
+    _out.append(f"  {key}: {value}")
+_out.append("")
 
 # ============================================================================
 # METHOD 3: Using Access Token for API Calls
 # ============================================================================
-print("\n" + "=" * 70)
-print("METHOD 3: Using Access Token for API Calls")
-print("-" * 70)
-print("Once authenticated, use the access token for all API requests.")
-print()
+_out.append("\n" + "=" * 70)
+_out.append("METHOD 3: Using Access Token for API Calls")
+_out.append("-" * 70)
+_out.append("Once authenticated, use the access token for all API requests.")
+_out.append("")
 
 example_token = "1234567890.AbCdEf.GhIjKlMnOpQrStUvWxYz"
 
-print("For HTTP REST requests:")
-print(f"  Authorization: Bearer {example_token}")
-print()
+_out.append("For HTTP REST requests:")
+_out.append(f"  Authorization: Bearer {example_token}")
+_out.append("")
 
-print("Example API Call:")
-print(f"  GET {BASE_URL}/api/v2/private/get_account_summary?currency=BTC")
-print(f"  Headers:")
-print(f"    Authorization: Bearer {example_token}")
-print(f"    Content-Type: application/json")
-print()
+_out.append("Example API Call:")
+_out.append(f"  GET {BASE_URL}/api/v2/private/get_account_summary?currency=BTC")
+_out.append(f"  Headers:")
+_out.append(f"    Authorization: Bearer {example_token}")
+_out.append(f"    Content-Type: application/json")
+_out.append("")
 
-print("For WebSocket requests (JSON-RPC):")
-print("""  {
+_out.append("For WebSocket requests (JSON-RPC):")
+_out.append("""  {
     "method": "private/get_account_summary",
     "params": {
       "currency": "BTC",
       "access_token": "%s"
     }
   }""" % example_token)
-print()
+_out.append("")
 
 # ============================================================================
 # Summary of Your Authentication Setup
 # ============================================================================
-print("\n" + "=" * 70)
-print("Your Authentication Setup Summary")
-print("=" * 70)
-print()
-
-print("Credentials:")
-print(f"  Client ID: {CLIENT_ID}")
-print(f"  Client Secret: {CLIENT_SECRET[:10]}... (hidden)")
-print(f"  Environment: Deribit Test (test.deribit.com)")
-print()
-
-print("How to set up YOUR credentials:")
-print("  Option 1: Create credentials.json")
-print("    - Copy credentials.json.template to credentials.json")
-print("    - Add your actual Client ID and Secret")
-print()
-print("  Option 2: Environment variables")
-print("    export DERIBIT_CLIENT_ID='your_id'")
-print("    export DERIBIT_CLIENT_SECRET='your_secret'")
-print()
-print("  Option 3: .env file")
-print("    - Copy .env.template to .env")
-print("    - Add your actual credentials")
-print()
-
-print("Available Scopes (based on your API key configuration):")
-print("  - account:read_write (manage account)")
-print("  - trade:read_write (place orders)")
-print("  - wallet:read (view balance)")
-print("  - session:name (persistent session)")
-print()
-
-print("Python Usage:")
-print("""
+_out.append("\n" + "=" * 70)
+_out.append("Your Authentication Setup Summary")
+_out.append("=" * 70)
+_out.append("")
+
+_out.append("Credentials:")
+_out.append(f"  Client ID: {CLIENT_ID}")
+_out.append(f"  Client Secret: {CLIENT_SECRET[:10]}... (hidden)")
+_out.append(f"  Environment: Deribit Test (test.deribit.com)")
+_out.append("")
+
+_out.append("How to set up YOUR credentials:")
+_out.append("  Option 1: Create credentials.json")
+_out.append("    - Copy credentials.json.template to credentials.json")
+_out.append("    - Add your actual Client ID and Secret")
+_out.append("")
+_out.append("  Option 2: Environment variables")
+_out.append("    export DERIBIT_CLIENT_ID='your_id'")
+_out.append("    export DERIBIT_CLIENT_SECRET='your_secret'")
+_out.append("")
+_out.append("  Option 3: .env file")
+_out.append("    - Copy .env.template to .env")
+_out.append("    - Add your actual credentials")
+_out.append("")
+
+_out.append("Available Scopes (based on your API key configuration):")
+_out.append("  - account:read_write (manage account)")
+_out.append("  - trade:read_write (place orders)")
+_out.append("  - wallet:read (view balance)")
+_out.append("  - session:name (persistent session)")
+_out.append("")
+
+_out.append("Python Usage:")
+_out.append("""
   from deribit_auth import DeribitAuth
 
   # Credentials loaded automatically from:
@@ -216,16 +221,18 @@ print("""
   )
 """)
 
-print()
-print("=" * 70)
-print("Authentication demonstration complete!")
-print("=" * 70)
-print()
-print("Note: Due to network restrictions in this environment, I cannot make")
-print("actual API calls. However, the code is correct and will work in your")
-print("local Python environment.")
-print()
-print("To test on your machine:")
-print("  1. Copy all the .py files to your computer")
-print("  2. Install requests: pip install requests")
-print("  3. Run: python test_with_credentials.py")
+_out.append("")
+_out.append("=" * 70)
+_out.append("Authentication demonstration complete!")
+_out.append("=" * 70)
+_out.append("")
+_out.append("Note: Due to network restrictions in this environment, I cannot make")
+_out.append("actual API calls. However, the code is correct and will work in your")
+_out.append("local Python environment.")
+_out.append("")
+_out.append("To test on your machine:")
+_out.append("  1. Copy all the .py files to your computer")
+_out.append("  2. Install requests: pip install requests")
+_out.append("  3. Run: python test_with_credentials.py")
+
+sys.stdout.write("\n".join(_out) + "\n")
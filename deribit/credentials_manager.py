@@ -17,6 +17,22 @@ import os
 import json
 from typing import Dict, Optional, Tuple
 
+# Prefer orjson for parsing (optional, falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Credential files are tiny; anything larger is rejected without parsing
+_MAX_CREDENTIALS_BYTES = 64 * 1024
+
+# .env variable name -> CredentialsManager attribute
+_DOTENV_KEYS = {
+    'DERIBIT_CLIENT_ID': 'client_id',
+    'DERIBIT_CLIENT_SECRET': 'client_secret',
+}
+
 
 class CredentialsManager:
     """
@@ -54,11 +70,12 @@ class CredentialsManager:
         filepath = filepath or self.credentials_file
 
         try:
-            if not os.path.exists(filepath):
+            with open(filepath, 'rb') as f:
+                data = f.read(_MAX_CREDENTIALS_BYTES + 1)
+            if len(data) > _MAX_CREDENTIALS_BYTES:
                 return False
 
-            with open(filepath, 'r') as f:
-                creds = json.load(f)
+            creds = _json_loads(data)
 
             self.client_id = creds.get('client_id')
             self.client_secret = creds.get('client_secret')
@@ -68,7 +85,7 @@ class CredentialsManager:
             else:
                 return False
 
-        except json.JSONDecodeError:
+        except (FileNotFoundError, ValueError):
             return False
         except Exception:
             return False
@@ -107,28 +124,33 @@ class CredentialsManager:
             True if successfully loaded
         """
         try:
-            if not os.path.exists(filepath):
-                return False
-
+            found = {}
             with open(filepath, 'r') as f:
                 for line in f:
                     line = line.strip()
-                    if line and not line.startswith('#'):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip().strip('"').strip("'")
+                    if not line or line[0] == '#':
+                        continue
+
+                    key, sep, value = line.partition('=')
+                    if not sep:
+                        continue
 
-                            if key == 'DERIBIT_CLIENT_ID':
-                                self.client_id = value
-                            elif key == 'DERIBIT_CLIENT_SECRET':
-                                self.client_secret = value
+                    # Read the whole file: a key repeated later overrides
+                    # the earlier value, as with other .env loaders
+                    attr = _DOTENV_KEYS.get(key.strip())
+                    if attr:
+                        found[attr] = value.strip().strip('\'"')
+
+            for attr, value in found.items():
+                setattr(self, attr, value)
 
             if self.client_id and self.client_secret:
                 return True
             else:
                 return False
 
+        except FileNotFoundError:
+            return False
         except Exception:
             return False
 
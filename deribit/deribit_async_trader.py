@@ -0,0 +1,364 @@
+"""
+Deribit Async Trading Module
+
+asyncio counterpart of DeribitTrader for running independent API calls
+concurrently (e.g. with asyncio.gather) instead of one after another.
+All calls share one httpx.AsyncClient (multiplexed over a single HTTP/2
+connection with http2=True) and are logged exactly like DeribitTrader
+calls.
+
+Requires the optional `httpx` package (HTTP/2 support needs the extra):
+    pip install 'httpx[http2]'
+
+Author: API Developer
+Environment: Deribit Test (test.deribit.com)
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from deribit_auth import DeribitAuth, _json_loads
+from deribit_trader import _METHOD_INFO, _CallLogMixin, _order_params
+
+# Try to import httpx (optional)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Try to import logger (optional)
+try:
+    from deribit_logger import DeribitLogger
+    LOGGER_AVAILABLE = True
+except ImportError:
+    LOGGER_AVAILABLE = False
+
+
+class AsyncDeribitTrader(_CallLogMixin):
+    """
+    Deribit Async Trading Interface
+
+    Mirrors the DeribitTrader API with async methods. Authentication stays
+    with the (synchronous) DeribitAuth instance; tokens are only refreshed
+    when they are about to expire.
+    """
+
+    def __init__(self, auth: DeribitAuth, http2: bool = False):
+        """
+        Initialize async trader with authentication
+
+        Args:
+            auth: Authenticated DeribitAuth instance
+            http2: Multiplex concurrent calls over one HTTP/2 connection
+                   (requires the h2 package; default: False, which uses
+                   pooled HTTP/1.1 connections)
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "AsyncDeribitTrader requires the 'httpx' package: pip install 'httpx[http2]'"
+            )
+
+        self.auth = auth
+        self.base_url = auth.base_url
+        self.logger = getattr(auth, "logger", None)
+        self._environment = getattr(auth, "_environment", "test")
+        self._api_url = f"{self.base_url}/api/v2/"
+        # Endpoint URLs for the known methods, built once
+        self._urls = {method: self._api_url + method for method in _METHOD_INFO}
+
+        # One client for the trader's lifetime, so every call reuses the
+        # same pooled (HTTP/2) connection
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncDeribitTrader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _make_request(self, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Make authenticated API request with automatic logging.
+
+        Trade actions (buy/sell/cancel/edit/close) are logged to trades_*.jsonl.
+        All other API calls are logged to api_*.jsonl.
+
+        Args:
+            method: API method name (e.g., 'private/buy')
+            params: Request parameters
+
+        Returns:
+            API response result
+        """
+        if method.startswith("private/"):
+            # get_headers() may refresh the token over blocking HTTP, so it
+            # runs on the default executor instead of the event loop
+            headers = await asyncio.get_running_loop().run_in_executor(None, self.auth.get_headers)
+        else:
+            headers = {}
+
+        # httpx already encodes booleans as lowercase "true"/"false"
+        start_ns = time.perf_counter_ns()
+        try:
+            url = self._urls.get(method) or self._api_url + method
+            response = await self.client.get(url, params=params, headers=headers)
+            if response.status_code >= 400:
+                DeribitAuth._handle_http_error(response)
+            result = _json_loads(response.content)
+        except Exception as e:
+            # Network/HTTP errors and undecodable bodies
+            self._log_failure(
+                method, params, start_ns, e,
+                getattr(getattr(e, "response", None), "status_code", None),
+            )
+            raise
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        if "result" in result:
+            self._log_call(method, params, latency_ms, response=result["result"])
+            return result["result"]
+
+        api_error = result.get("error", result)
+        error = Exception(f"API Error: {api_error}")
+        if self.logger is not None:
+            self._log_call(method, params, latency_ms, error=DeribitLogger.format_error(
+                exception=error,
+                error_code=api_error.get("code") if isinstance(api_error, dict) else None,
+                error_message=api_error.get("message") if isinstance(api_error, dict) else str(api_error),
+                http_status=response.status_code,
+            ))
+        raise error
+
+    def _log_failure(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        start_ns: int,
+        exception: Exception,
+        http_status: Optional[int],
+    ) -> None:
+        """Log a network/HTTP failure (no-op without a logger)"""
+        if self.logger is not None:
+            self._log_call(
+                method,
+                params,
+                (time.perf_counter_ns() - start_ns) / 1_000_000,
+                error=DeribitLogger.format_error(exception=exception, http_status=http_status),
+            )
+
+    # =================================================================
+    # ACCOUNT INFORMATION
+    # =================================================================
+
+    async def get_account_summary(self, currency: str = "BTC", extended: bool = True) -> Dict[str, Any]:
+        """
+        Get account summary
+
+        Args:
+            currency: Currency (BTC, ETH, USDC, etc.)
+            extended: Include additional fields
+
+        Returns:
+            Account summary with balance, equity, etc.
+        """
+        return await self._make_request(
+            "private/get_account_summary",
+            {"currency": currency, "extended": extended}
+        )
+
+    async def get_positions(self, currency: str = "BTC", kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get current positions
+
+        Args:
+            currency: Currency (BTC, ETH, etc.)
+            kind: Instrument kind (future, option, spot, etc.)
+
+        Returns:
+            List of open positions
+        """
+        params = {"currency": currency}
+        if kind:
+            params["kind"] = kind
+
+        return await self._make_request("private/get_positions", params)
+
+    # =================================================================
+    # MARKET DATA
+    # =================================================================
+
+    async def get_instruments(self, currency: str = "BTC", kind: Optional[str] = None,
+                              expired: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get available instruments
+
+        Args:
+            currency: Currency (BTC, ETH, etc.)
+            kind: Instrument kind (future, option, spot)
+            expired: Include expired instruments
+
+        Returns:
+            List of instruments
+        """
+        params = {"currency": currency, "expired": expired}
+        if kind:
+            params["kind"] = kind
+
+        return await self._make_request("public/get_instruments", params)
+
+    async def get_order_book(self, instrument_name: str, depth: int = 10) -> Dict[str, Any]:
+        """
+        Get order book for an instrument
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+            depth: Order book depth
+
+        Returns:
+            Order book with bids and asks
+        """
+        return await self._make_request(
+            "public/get_order_book",
+            {"instrument_name": instrument_name, "depth": depth}
+        )
+
+    async def get_ticker(self, instrument_name: str) -> Dict[str, Any]:
+        """
+        Get ticker data for an instrument
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+
+        Returns:
+            Ticker data with current price, volume, etc.
+        """
+        return await self._make_request(
+            "public/ticker",
+            {"instrument_name": instrument_name}
+        )
+
+    # =================================================================
+    # ORDERS
+    # =================================================================
+
+    async def get_open_orders(self, currency: str = "BTC", kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get open orders for a currency
+
+        Args:
+            currency: Currency (BTC, ETH, etc.)
+            kind: Filter by kind (future, option)
+
+        Returns:
+            List of open orders
+        """
+        params = {"currency": currency}
+        if kind:
+            params["kind"] = kind
+
+        return await self._make_request("private/get_open_orders_by_currency", params)
+
+    async def buy(
+        self,
+        instrument_name: str,
+        amount: float,
+        order_type: str = "market",
+        price: Optional[float] = None,
+        post_only: bool = False,
+        reduce_only: bool = False,
+        label: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Place a buy order
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+            amount: Order amount in contracts
+            order_type: Order type ('market', 'limit', 'stop_limit', etc.)
+            price: Limit price (required for limit orders)
+            post_only: Post-only order (only maker)
+            reduce_only: Reduce-only order (close position only)
+            label: User-defined label
+
+        Returns:
+            Order details including order_id
+        """
+        return await self._make_request(
+            "private/buy",
+            _order_params(instrument_name, amount, order_type, price, post_only, reduce_only, label),
+        )
+
+    async def sell(
+        self,
+        instrument_name: str,
+        amount: float,
+        order_type: str = "market",
+        price: Optional[float] = None,
+        post_only: bool = False,
+        reduce_only: bool = False,
+        label: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Place a sell order
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+            amount: Order amount in contracts
+            order_type: Order type ('market', 'limit', 'stop_limit', etc.)
+            price: Limit price (required for limit orders)
+            post_only: Post-only order (only maker)
+            reduce_only: Reduce-only order (close position only)
+            label: User-defined label
+
+        Returns:
+            Order details including order_id
+        """
+        return await self._make_request(
+            "private/sell",
+            _order_params(instrument_name, amount, order_type, price, post_only, reduce_only, label),
+        )
+
+    async def cancel_order(self, order_id: str) -> Dict[str, Any]:
+        """
+        Cancel an order
+
+        Args:
+            order_id: Order ID to cancel
+
+        Returns:
+            Cancelled order details
+        """
+        return await self._make_request("private/cancel", {"order_id": order_id})
+
+
+async def main():
+    """
+    Example usage of AsyncDeribitTrader
+    """
+    auth = DeribitAuth(test_mode=True)
+    auth.authenticate_credentials(scope="trade:read_write session:async_demo")
+
+    async with AsyncDeribitTrader(auth) as trader:
+        # All three requests are in flight at the same time
+        summary, ticker, book = await asyncio.gather(
+            trader.get_account_summary("BTC"),
+            trader.get_ticker("BTC-PERPETUAL"),
+            trader.get_order_book("BTC-PERPETUAL", depth=5),
+        )
+        print(f"Balance: {summary.get('balance')} BTC")
+        print(f"BTC-PERPETUAL Last Price: {ticker.get('last_price')}")
+        print(f"Best bid/ask: {book.get('best_bid_price')} / {book.get('best_ask_price')}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
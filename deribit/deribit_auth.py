@@ -18,19 +18,48 @@ Environment: Deribit Test (test.deribit.com)
 
 import os
 import time
-import hmac
+import atexit
+import functools
 import hashlib
-import random
-import string
-import requests
-from typing import Optional, Dict, Any
-
-# Try to import credentials manager (optional)
+import importlib.util
+import secrets
+import socket
+import threading
+import warnings
+from typing import Optional, Dict, Any, ClassVar, Tuple, Union
+
+# Prefer orjson for JSON encoding/decoding (optional, falls back to stdlib json)
 try:
-    from credentials_manager import CredentialsManager
-    CREDENTIALS_MANAGER_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CREDENTIALS_MANAGER_AVAILABLE = False
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    ORJSON_AVAILABLE = False
+
+# httpx is the optional HTTP/2 transport; like requests, it is only
+# imported once a session for that transport is built
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+# httpx needs the h2 package to actually negotiate HTTP/2
+H2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec("h2") is not None
+
+# Signatures use OpenSSL's SHA-256 when hashlib is built against it, which
+# picks up CPU SHA extensions (SHA-NI / ARMv8 crypto) where available.
+_sha256 = hashlib.sha256
+SHA256_OPENSSL = getattr(_sha256, "__module__", None) == "_hashlib"
+if not SHA256_OPENSSL:
+    warnings.warn(
+        "hashlib is not backed by OpenSSL; HMAC-SHA256 signatures will use "
+        "the slower builtin SHA-256 implementation",
+        RuntimeWarning,
+    )
 
 # Try to import logger (optional)
 try:
@@ -40,6 +69,93 @@ except ImportError:
     LOGGER_AVAILABLE = False
 
 
+# Options for every pooled socket: TCP_NODELAY so small JSON-RPC requests
+# are not held back by Nagle's algorithm, and TCP keep-alive probes so idle
+# pooled sockets are not silently dropped by NATs/load balancers. Buffer
+# sizes are left to the kernel, as fixed SO_SNDBUF/SO_RCVBUF values would
+# disable its autotuning.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+def _get_credentials_manager():
+    """Import CredentialsManager on first use (optional); None if unavailable"""
+    try:
+        from credentials_manager import CredentialsManager
+    except ImportError:
+        return None
+    return CredentialsManager
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_credentials(
+    credentials_file: Optional[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Find credentials in credentials.json, the environment or .env
+
+    Cached per credentials_file, so several DeribitAuth instances in one
+    process read and parse the sources only once.
+
+    Args:
+        credentials_file: Custom path to credentials JSON file
+
+    Returns:
+        Tuple of (client_id, client_secret, source); all None if not found
+    """
+    credentials_manager_cls = _get_credentials_manager()
+    if credentials_manager_cls:
+        creds_path = credentials_file or "credentials.json"
+        manager = credentials_manager_cls(creds_path)
+        client_id, client_secret = manager.load(interactive=False)
+        if not (client_id and client_secret):
+            return None, None, None
+        # Determine which source the manager used
+        if os.path.exists(creds_path):
+            source = f"json_file:{creds_path}"
+        elif os.getenv("DERIBIT_CLIENT_ID"):
+            source = "environment_variables"
+        elif os.path.exists(".env"):
+            source = "dotenv_file"
+        else:
+            source = "credentials_manager"
+        return client_id, client_secret, source
+
+    client_id = os.getenv('DERIBIT_CLIENT_ID')
+    client_secret = os.getenv('DERIBIT_CLIENT_SECRET')
+    if client_id and client_secret:
+        return client_id, client_secret, "environment_variables"
+    return None, None, None
+
+
+def _load_requests():
+    """Import requests (and its adapter/retry helpers) on first use"""
+    global requests, HTTPAdapter, Retry
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    return requests
+
+
+def __getattr__(name: str) -> Any:
+    # requests pulls in urllib3, idna, certifi and charset detection, so it
+    # is only imported once a requests session is built (or it is accessed
+    # as deribit_auth.requests)
+    if name == "requests":
+        return _load_requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Status line printed (verbose mode) after a successful public/auth, by grant type
+_AUTH_SUCCESS_MESSAGES = {
+    "client_credentials": "Authenticated successfully",
+    "client_signature": "Authenticated with signature",
+    "refresh_token": "Token refreshed",
+}
+
+
 class DeribitAuth:
     """
     Deribit API Authentication Handler
@@ -50,6 +166,10 @@ class DeribitAuth:
     - Refresh Token
     """
 
+    # Keep-alive sessions shared by all instances that talk to the same host
+    _sessions: ClassVar[Dict[str, Any]] = {}
+    _sessions_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -57,6 +177,10 @@ class DeribitAuth:
         test_mode: bool = True,
         credentials_file: Optional[str] = None,
         logger: Optional["DeribitLogger"] = None,
+        verbose: bool = False,
+        http2: bool = False,
+        warmup: bool = False,
+        token_cache: Union[bool, str] = False,
     ):
         """
         Initialize Deribit Authentication
@@ -73,8 +197,24 @@ class DeribitAuth:
             test_mode: Use test environment (default: True)
             credentials_file: Custom path to credentials JSON file
             logger: Optional DeribitLogger instance for audit logging
+            verbose: Print a summary after each successful auth call
+                     (default: False; events are still sent to the logger)
+            http2: Use an HTTP/2 httpx.Client instead of requests, so
+                   concurrent calls share one multiplexed connection
+                   (requires: pip install 'httpx[http2]'; default: False)
+            warmup: Start opening the HTTPS connection in the background
+                    now (see warmup()); the first auth request waits for
+                    it and reuses the socket instead of dialing its own
+            token_cache: Persist issued tokens on disk so ensure_authenticated()
+                         can skip public/auth in the next process (True for
+                         ~/.cache/deribit/, or a file path; default: False)
         """
+        if http2 and not HTTPX_AVAILABLE:
+            raise ImportError("http2=True requires httpx: pip install 'httpx[http2]'")
+
         self.logger = logger
+        self.verbose = verbose
+        self.http2 = http2
         self._credentials_source = None
 
         # Try to load credentials from various sources
@@ -82,25 +222,13 @@ class DeribitAuth:
             self.client_id = client_id
             self.client_secret = client_secret
             self._credentials_source = "direct_parameters"
-        elif CREDENTIALS_MANAGER_AVAILABLE:
-            manager = CredentialsManager(credentials_file or "credentials.json")
-            self.client_id, self.client_secret = manager.load(interactive=False)
-            if self.client_id and self.client_secret:
-                # Determine which source the manager used
-                creds_path = credentials_file or "credentials.json"
-                if os.path.exists(creds_path):
-                    self._credentials_source = f"json_file:{creds_path}"
-                elif os.getenv("DERIBIT_CLIENT_ID"):
-                    self._credentials_source = "environment_variables"
-                elif os.path.exists(".env"):
-                    self._credentials_source = "dotenv_file"
-                else:
-                    self._credentials_source = "credentials_manager"
         else:
-            self.client_id = client_id or os.getenv('DERIBIT_CLIENT_ID')
-            self.client_secret = client_secret or os.getenv('DERIBIT_CLIENT_SECRET')
-            if self.client_id and self.client_secret:
-                self._credentials_source = "environment_variables"
+            self.client_id, self.client_secret, self._credentials_source = (
+                _discover_credentials(credentials_file)
+            )
+            if not self.client_id:
+                # Don't remember a miss: credentials added later are picked up
+                _discover_credentials.cache_clear()
 
         if not self.client_id or not self.client_secret:
             raise ValueError(
@@ -112,28 +240,170 @@ class DeribitAuth:
                 "See README.md for detailed setup instructions."
             )
 
+        # Prime the HMAC inner/outer SHA-256 states once; each signature then
+        # only copies them instead of re-deriving the padded key schedule.
+        # The encoded secret is only needed here, so it is not kept around.
+        key = self.client_secret.encode('utf-8')
+        if len(key) > 64:
+            key = _sha256(key).digest()
+        key = key.ljust(64, b"\x00")
+        self._hmac_inner = _sha256(bytes(b ^ 0x36 for b in key))
+        self._hmac_outer = _sha256(bytes(b ^ 0x5C for b in key))
+
         self.test_mode = test_mode
         self.base_url = "https://test.deribit.com" if test_mode else "https://www.deribit.com"
+        self._auth_url = f"{self.base_url}/api/v2/public/auth"
+        self._account_url = f"{self.base_url}/api/v2/private/get_account_summary"
+        self._test_url = f"{self.base_url}/api/v2/public/test"
+
+        # Fixed parts of the public/auth params, built once per instance
+        self._creds_params_base = {
+            "grant_type": "client_credentials",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        self._sig_params_base = {
+            "grant_type": "client_signature",
+            "client_id": self.client_id,
+        }
+        # Encoded client_credentials request bodies, keyed by scope
+        self._creds_bodies: Dict[str, bytes] = {}
         self._environment = "test" if test_mode else "production"
         self.access_token = None
         self.refresh_token = None
-        self.token_expiry = None
+        self.token_expiry = None  # time.monotonic() deadline
         self.scope = None
-        self.session = requests.Session()
+        self._scope_requested = None  # scope passed to the last public/auth login
+        # Guards the token fields above and serializes refreshes, so a
+        # background refresh never races another one for the single-use
+        # refresh_token (reentrant: refreshes store tokens while holding it)
+        self._token_lock = threading.RLock()
+        # (access_token, headers built for it), swapped as one attribute so
+        # threads never pair a token with another token's headers
+        self._cached_headers = (None, None)
+
+        # Token cache file, one per environment and client_id; it holds
+        # live tokens, so it is only readable by the owner (0600)
+        if token_cache is True:
+            client_hash = _sha256(self.client_id.encode("utf-8")).hexdigest()[:12]
+            token_cache = os.path.join(
+                os.path.expanduser("~"), ".cache", "deribit",
+                f"token_{self._environment}_{client_hash}.json",
+            )
+        self._token_cache_path = token_cache or None
+
+        # One pooled keep-alive session per base_url (and transport), shared
+        # by every instance (and DeribitTrader), so follow-up requests skip
+        # the TLS handshake.
+        session_key = f"{self.base_url}#h2" if http2 else self.base_url
+        with DeribitAuth._sessions_lock:
+            session = DeribitAuth._sessions.get(session_key)
+            if session is None:
+                if http2:
+                    session = self._build_http2_client(self.base_url)
+                else:
+                    session = self._build_session(self.base_url)
+                DeribitAuth._sessions[session_key] = session
+        self.session = session
+
+        # Fields shared by every auth log entry from this instance
+        self._log_context = {
+            "client_id": self.client_id,
+            "credentials_source": self._credentials_source,
+            "environment": self._environment,
+            "base_url": self.base_url,
+        }
 
         # Log session start
         if self.logger:
             self.logger.log_auth(
                 event="session_start",
-                client_id=self.client_id,
-                credentials_source=self._credentials_source,
-                environment=self._environment,
-                base_url=self.base_url,
+                **self._log_context,
+            )
+
+        self._warmup_thread = None
+        if warmup:
+            self._warmup_thread = threading.Thread(
+                target=self.warmup, name="deribit-warmup", daemon=True
             )
+            self._warmup_thread.start()
+
+    @staticmethod
+    def _build_session(base_url: str) -> "requests.Session":
+        """Create a pooled keep-alive requests session that retries public reads"""
+        _load_requests()
+        session = requests.Session()
+        # Large enough pool that bursts of concurrent calls keep their
+        # sockets instead of discarding and re-opening TLS connections;
+        # past the limit, extra sockets are opened rather than blocking.
+        # No retries by default: every API call is a GET, including
+        # private/buy, private/sell, private/cancel_all etc., and a gateway
+        # 5xx can arrive after an order was already accepted.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=50, pool_block=False)
+        # Applies to every connection pool the adapter creates from now on
+        adapter.poolmanager.connection_pool_kw["socket_options"] = _SOCKET_OPTIONS
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # public/* GETs (market data, instruments) only read, so they are
+        # retried on 429/5xx. The adapter shares the pool manager above,
+        # so public and private calls still reuse the same sockets.
+        read_adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            ),
+        )
+        read_adapter.poolmanager = adapter.poolmanager
+        session.mount(f"{base_url}/api/v2/public/", read_adapter)
+        session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": "deribit-auth/1.0",
+            # Explicit so proxies keep idle sockets open between calls
+            "Connection": "keep-alive",
+        })
+        return session
+
+    @staticmethod
+    def _build_http2_client(base_url: str) -> "httpx.Client":
+        """Create an HTTP/2 httpx client that multiplexes calls on one connection"""
+        import httpx
+        return httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=16),
+                socket_options=_SOCKET_OPTIONS,
+            ),
+            base_url=base_url,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "deribit-auth/1.0",
+            },
+        )
+
+    @classmethod
+    def close_sessions(cls) -> None:
+        """
+        Close every shared keep-alive session/client
+
+        Runs automatically at interpreter exit; call it earlier to release
+        pooled connections. Instances created afterwards open new ones.
+        """
+        with cls._sessions_lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.close()
 
     def _generate_nonce(self, length: int = 8) -> str:
-        """Generate random nonce for signature authentication"""
-        return ''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(length))
+        """Generate random hex nonce for signature authentication (CSPRNG)"""
+        if length % 2 == 0:
+            return secrets.token_hex(length // 2)
+        return secrets.token_hex(length // 2 + 1)[:length]
 
     def _calculate_signature(
         self,
@@ -157,116 +427,212 @@ class DeribitAuth:
         """
         string_to_sign = f"{timestamp}\n{nonce}\n{data}"
 
-        signature = hmac.new(
-            self.client_secret.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-
-        return signature
-
-    def authenticate_credentials(self, scope: str = "session:default") -> Dict[str, Any]:
+        inner = self._hmac_inner.copy()
+        inner.update(string_to_sign.encode('utf-8'))
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    @staticmethod
+    def _encode_auth_body(params: Dict[str, Any]) -> bytes:
+        """Serialize public/auth params into a JSON-RPC request body"""
+        return _json_dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "public/auth",
+            "params": params
+        })
+
+    def _post_auth(self, params: Dict[str, Any], body: Optional[bytes] = None) -> Any:
         """
-        Authenticate using Client Credentials (simplest method)
+        Send a public/auth request as a JSON-RPC POST body
+
+        Keeps secrets and signatures out of the URL (and out of proxy/access
+        logs) and skips query-string encoding of every parameter.
 
         Args:
-            scope: Access scope (default: "session:default")
-                   Options: "connection", "session:name", "trade:read_write", etc.
+            params: public/auth parameters
+            body: Pre-encoded request body for params (encoded here if None)
 
         Returns:
-            Authentication response with access_token and refresh_token
+            HTTP response (requests or httpx)
         """
-        url = f"{self.base_url}/api/v2/public/auth"
+        if body is None:
+            body = self._encode_auth_body(params)
+        if self._warmup_thread is not None:
+            # Let an in-flight warmup finish so its pooled socket is reused
+            self._warmup_thread.join()
+            self._warmup_thread = None
+        if self.http2:
+            return self.session.post(self._auth_url, content=body)
+        return self.session.post(self._auth_url, data=body)
+
+    @staticmethod
+    def _handle_http_error(response: Any) -> None:
+        """
+        Raise an HTTPError for a 4xx/5xx response
 
-        params = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": scope
-        }
+        Deribit returns a JSON-RPC error body alongside most HTTP errors,
+        so its code/message are included when the body parses.
 
-        start_time = time.time()
+        Args:
+            response: HTTP response (requests or httpx)
+
+        Raises:
+            requests.HTTPError: For a requests response
+            httpx.HTTPStatusError: For an httpx response
+        """
+        detail = ""
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            latency_ms = (time.time() - start_time) * 1000
+            api_error = _json_loads(response.content).get("error")
+            if api_error:
+                detail = f" ({api_error.get('code')}: {api_error.get('message')})"
+        except (ValueError, AttributeError):
+            pass
+        message = f"{response.status_code} Error for url: {response.url}{detail}"
+        if type(response).__module__.startswith("httpx"):
+            import httpx
+            raise httpx.HTTPStatusError(message, request=response.request, response=response)
+        raise _load_requests().HTTPError(message, response=response)
+
+    def _do_auth_request(
+        self,
+        params: Dict[str, Any],
+        method: str,
+        event: str,
+        failure_event: str = "auth_failure",
+        scope: Optional[str] = None,
+        body: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a public/auth request and store the issued tokens
 
-            result = response.json()
+        Shared by all grant types (client_credentials, client_signature,
+        refresh_token), including success/failure logging.
 
-            if "result" in result:
-                self.access_token = result["result"]["access_token"]
-                self.refresh_token = result["result"]["refresh_token"]
-                self.token_expiry = time.time() + result["result"]["expires_in"]
-                self.scope = result["result"]["scope"]
+        Args:
+            params: public/auth parameters
+            method: Grant type, used for messages and log entries
+            event: Log event name on success
+            failure_event: Log event name on failure
+            scope: Scope requested (None when refreshing a token)
+            body: Pre-encoded request body for params, if already built
 
-                print(f"Authenticated successfully")
+        Returns:
+            Authentication response with access_token and refresh_token
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            response = self._post_auth(params, body)
+            if response.status_code >= 400:
+                self._handle_http_error(response)
+            result = _json_loads(response.content)
+        except Exception as e:
+            # HTTP 4xx/5xx from _handle_http_error carry the response;
+            # network errors (requests or httpx) and undecodable bodies don't
+            response = getattr(e, "response", None)
+            self._log_auth_failure(
+                e, method, failure_event, scope, start_ns,
+                http_status=response.status_code if response is not None else None,
+            )
+            raise
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        if "result" not in result:
+            failure = "Token refresh failed" if method == "refresh_token" else "Authentication failed"
+            error = Exception(f"{failure}: {result}")
+            api_error = result.get("error", {})
+            self._log_auth_failure(
+                error, method, failure_event, scope, start_ns,
+                http_status=response.status_code,
+                error_code=api_error.get("code"),
+                error_message=api_error.get("message"),
+            )
+            raise error
+
+        auth_result = result["result"]
+        with self._token_lock:
+            self.access_token = auth_result["access_token"]
+            self.refresh_token = auth_result["refresh_token"]
+            self.token_expiry = time.monotonic() + auth_result["expires_in"]
+            if scope is not None:
+                self.scope = auth_result["scope"]
+                self._scope_requested = scope
+
+        if self._token_cache_path:
+            self._save_token_cache(auth_result["expires_in"])
+
+        if self.verbose:
+            print(_AUTH_SUCCESS_MESSAGES[method])
+            if scope is not None:
                 print(f"  Scope: {self.scope}")
-                print(f"  Expires in: {result['result']['expires_in']} seconds")
+            print(f"  Expires in: {auth_result['expires_in']} seconds")
 
-                if self.logger:
-                    self.logger.log_auth(
-                        event="auth_credentials",
-                        client_id=self.client_id,
-                        method="client_credentials",
-                        scope_requested=scope,
-                        scope_granted=self.scope,
-                        token_expires_in=result["result"]["expires_in"],
-                        access_token=self.access_token,
-                        credentials_source=self._credentials_source,
-                        status="success",
-                        latency_ms=latency_ms,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
-                    )
+        if self.logger:
+            self.logger.log_auth(
+                event=event,
+                **self._log_context,
+                method=method,
+                scope_requested=scope,
+                scope_granted=self.scope if scope is not None else None,
+                token_expires_in=auth_result["expires_in"],
+                access_token=self.access_token,
+                status="success",
+                latency_ms=latency_ms,
+                api_method="public/auth",
+            )
 
-                return result["result"]
-            else:
-                error = Exception(f"Authentication failed: {result}")
-                if self.logger:
-                    api_error = result.get("error", {})
-                    self.logger.log_auth(
-                        event="auth_failure",
-                        client_id=self.client_id,
-                        method="client_credentials",
-                        scope_requested=scope,
-                        credentials_source=self._credentials_source,
-                        status="error",
-                        latency_ms=latency_ms,
-                        error=DeribitLogger.format_error(
-                            exception=error,
-                            error_code=api_error.get("code"),
-                            error_message=api_error.get("message"),
-                            http_status=response.status_code,
-                        ),
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
-                    )
-                raise error
+        return auth_result
 
-        except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            if self.logger and not isinstance(e, Exception.__class__):
-                # Log network/HTTP errors (API errors already logged above)
-                http_status = getattr(getattr(e, "response", None), "status_code", None)
-                self.logger.log_auth(
-                    event="auth_failure",
-                    client_id=self.client_id,
-                    method="client_credentials",
-                    scope_requested=scope,
-                    credentials_source=self._credentials_source,
-                    status="error",
-                    latency_ms=latency_ms,
-                    error=DeribitLogger.format_error(
-                        exception=e,
-                        http_status=http_status,
-                    ),
-                    environment=self._environment,
-                    base_url=self.base_url,
-                    api_method="public/auth",
-                )
-            raise
+    def _log_auth_failure(
+        self,
+        exception: Exception,
+        method: str,
+        failure_event: str,
+        scope: Optional[str],
+        start_ns: int,
+        http_status: Optional[int] = None,
+        error_code: Optional[int] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Log a failed public/auth request (no-op without a logger)"""
+        if not self.logger:
+            return
+        self.logger.log_auth(
+            event=failure_event,
+            **self._log_context,
+            method=method,
+            scope_requested=scope,
+            status="error",
+            latency_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+            error=DeribitLogger.format_error(
+                exception=exception,
+                error_code=error_code,
+                error_message=error_message,
+                http_status=http_status,
+            ),
+            api_method="public/auth",
+        )
+
+    def authenticate_credentials(self, scope: str = "session:default") -> Dict[str, Any]:
+        """
+        Authenticate using Client Credentials (simplest method)
+
+        Args:
+            scope: Access scope (default: "session:default")
+                   Options: "connection", "session:name", "trade:read_write", etc.
+
+        Returns:
+            Authentication response with access_token and refresh_token
+        """
+        params = {**self._creds_params_base, "scope": scope}
+        # The body is deterministic for a given scope, so encode it only once
+        body = self._creds_bodies.get(scope)
+        if body is None:
+            body = self._creds_bodies[scope] = self._encode_auth_body(params)
+        return self._do_auth_request(
+            params, "client_credentials", "auth_credentials", scope=scope, body=body
+        )
 
     def authenticate_signature(self, scope: str = "session:default", data: str = "") -> Dict[str, Any]:
         """
@@ -281,103 +647,19 @@ class DeribitAuth:
         Returns:
             Authentication response with access_token and refresh_token
         """
-        url = f"{self.base_url}/api/v2/public/auth"
-
-        timestamp = int(time.time() * 1000)  # milliseconds
+        timestamp = time.time_ns() // 1_000_000  # milliseconds
         nonce = self._generate_nonce()
         signature = self._calculate_signature(timestamp, nonce, data)
 
         params = {
-            "grant_type": "client_signature",
-            "client_id": self.client_id,
+            **self._sig_params_base,
             "timestamp": timestamp,
             "nonce": nonce,
             "data": data,
             "signature": signature,
             "scope": scope
         }
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            latency_ms = (time.time() - start_time) * 1000
-
-            result = response.json()
-
-            if "result" in result:
-                self.access_token = result["result"]["access_token"]
-                self.refresh_token = result["result"]["refresh_token"]
-                self.token_expiry = time.time() + result["result"]["expires_in"]
-                self.scope = result["result"]["scope"]
-
-                print(f"Authenticated with signature")
-                print(f"  Scope: {self.scope}")
-                print(f"  Expires in: {result['result']['expires_in']} seconds")
-
-                if self.logger:
-                    self.logger.log_auth(
-                        event="auth_signature",
-                        client_id=self.client_id,
-                        method="client_signature",
-                        scope_requested=scope,
-                        scope_granted=self.scope,
-                        token_expires_in=result["result"]["expires_in"],
-                        access_token=self.access_token,
-                        credentials_source=self._credentials_source,
-                        status="success",
-                        latency_ms=latency_ms,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
-                    )
-
-                return result["result"]
-            else:
-                error = Exception(f"Authentication failed: {result}")
-                if self.logger:
-                    api_error = result.get("error", {})
-                    self.logger.log_auth(
-                        event="auth_failure",
-                        client_id=self.client_id,
-                        method="client_signature",
-                        scope_requested=scope,
-                        credentials_source=self._credentials_source,
-                        status="error",
-                        latency_ms=latency_ms,
-                        error=DeribitLogger.format_error(
-                            exception=error,
-                            error_code=api_error.get("code"),
-                            error_message=api_error.get("message"),
-                            http_status=response.status_code,
-                        ),
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
-                    )
-                raise error
-
-        except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            if self.logger and not isinstance(e, Exception.__class__):
-                http_status = getattr(getattr(e, "response", None), "status_code", None)
-                self.logger.log_auth(
-                    event="auth_failure",
-                    client_id=self.client_id,
-                    method="client_signature",
-                    scope_requested=scope,
-                    credentials_source=self._credentials_source,
-                    status="error",
-                    latency_ms=latency_ms,
-                    error=DeribitLogger.format_error(
-                        exception=e,
-                        http_status=http_status,
-                    ),
-                    environment=self._environment,
-                    base_url=self.base_url,
-                    api_method="public/auth",
-                )
-            raise
+        return self._do_auth_request(params, "client_signature", "auth_signature", scope=scope)
 
     def refresh_access_token(self) -> Dict[str, Any]:
         """
@@ -386,91 +668,121 @@ class DeribitAuth:
         Returns:
             New authentication response with fresh tokens
         """
-        if not self.refresh_token:
-            raise Exception("No refresh token available. Authenticate first.")
-
-        url = f"{self.base_url}/api/v2/public/auth"
-
-        params = {
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token
-        }
-
-        start_time = time.time()
+        # One refresh at a time: each refresh_token can only be used once
+        with self._token_lock:
+            if not self.refresh_token:
+                raise Exception("No refresh token available. Authenticate first.")
+
+            params = {
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token
+            }
+            return self._do_auth_request(params, "refresh_token", "token_refresh", failure_event="token_refresh")
+
+    def _save_token_cache(self, expires_in: float) -> None:
+        """Write the current tokens to the cache file (owner-only, atomic)"""
+        path = self._token_cache_path
+        data = _json_dumps({
+            "client_id": self.client_id,
+            "environment": self._environment,
+            "scope_requested": self._scope_requested,
+            "scope": self.scope,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": time.time() + expires_in,  # wall clock: survives restarts
+        })
+        tmp_path = f"{path}.{os.getpid()}.tmp"
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            latency_ms = (time.time() - start_time) * 1000
-
-            result = response.json()
+            os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A read-only home must not break authentication
+            warnings.warn(f"Could not write token cache {path}: {e}", RuntimeWarning)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _load_token_cache(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Read cached tokens issued to this client/environment for scope"""
+        try:
+            with open(self._token_cache_path, "rb") as f:
+                cached = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("client_id") != self.client_id
+            or cached.get("environment") != self._environment
+            or cached.get("scope_requested") != scope
+            or not cached.get("access_token")
+        ):
+            return None
+        return cached
+
+    def ensure_authenticated(self, scope: str = "session:default") -> Dict[str, Any]:
+        """
+        Authenticate only if needed, reusing a cached token when possible
 
-            if "result" in result:
-                self.access_token = result["result"]["access_token"]
-                self.refresh_token = result["result"]["refresh_token"]
-                self.token_expiry = time.time() + result["result"]["expires_in"]
+        In order: keep the in-memory token, reuse the token from the cache
+        file (see token_cache) if it is valid for more than 60 seconds,
+        refresh it with the cached refresh_token, and only then fall back
+        to authenticate_credentials().
 
-                print(f"Token refreshed")
-                print(f"  Expires in: {result['result']['expires_in']} seconds")
+        Args:
+            scope: Access scope (default: "session:default")
 
+        Returns:
+            Dict with access_token, refresh_token, expires_in and scope
+        """
+        if self._scope_requested == scope and self.is_token_valid():
+            return self._token_state()
+
+        cached = self._load_token_cache(scope) if self._token_cache_path else None
+        if cached is not None:
+            remaining = cached.get("expires_at", 0) - time.time()
+            with self._token_lock:
+                self.access_token = cached["access_token"]
+                self.refresh_token = cached.get("refresh_token")
+                self.token_expiry = time.monotonic() + remaining
+                self.scope = cached.get("scope")
+                self._scope_requested = scope
+
+            if self.is_token_valid():
+                if self.verbose:
+                    print("Reused cached token")
+                    print(f"  Scope: {self.scope}")
+                    print(f"  Expires in: {int(remaining)} seconds")
                 if self.logger:
                     self.logger.log_auth(
-                        event="token_refresh",
-                        client_id=self.client_id,
-                        method="refresh_token",
-                        token_expires_in=result["result"]["expires_in"],
+                        event="token_cache_hit",
+                        **self._log_context,
+                        scope_requested=scope,
+                        token_expires_in=int(remaining),
                         access_token=self.access_token,
-                        credentials_source=self._credentials_source,
                         status="success",
-                        latency_ms=latency_ms,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
                     )
+                return self._token_state()
 
-                return result["result"]
-            else:
-                error = Exception(f"Token refresh failed: {result}")
-                if self.logger:
-                    api_error = result.get("error", {})
-                    self.logger.log_auth(
-                        event="token_refresh",
-                        client_id=self.client_id,
-                        method="refresh_token",
-                        credentials_source=self._credentials_source,
-                        status="error",
-                        latency_ms=latency_ms,
-                        error=DeribitLogger.format_error(
-                            exception=error,
-                            error_code=api_error.get("code"),
-                            error_message=api_error.get("message"),
-                            http_status=response.status_code,
-                        ),
-                        environment=self._environment,
-                        base_url=self.base_url,
-                        api_method="public/auth",
-                    )
-                raise error
+            if self.refresh_token:
+                try:
+                    return self.refresh_access_token()
+                except Exception:
+                    pass  # e.g. refresh token expired too; log in again
 
-        except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            if self.logger and not isinstance(e, Exception.__class__):
-                http_status = getattr(getattr(e, "response", None), "status_code", None)
-                self.logger.log_auth(
-                    event="token_refresh",
-                    client_id=self.client_id,
-                    method="refresh_token",
-                    credentials_source=self._credentials_source,
-                    status="error",
-                    latency_ms=latency_ms,
-                    error=DeribitLogger.format_error(
-                        exception=e,
-                        http_status=http_status,
-                    ),
-                    environment=self._environment,
-                    base_url=self.base_url,
-                    api_method="public/auth",
-                )
-            raise
+        return self.authenticate_credentials(scope)
+
+    def _token_state(self) -> Dict[str, Any]:
+        """Current tokens in the shape of a public/auth result"""
+        return {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_in": int(self.token_expiry - time.monotonic()),
+            "scope": self.scope,
+        }
 
     def is_token_valid(self, buffer_seconds: int = 60) -> bool:
         """
@@ -485,33 +797,63 @@ class DeribitAuth:
         if not self.access_token or not self.token_expiry:
             return False
 
-        return time.time() < (self.token_expiry - buffer_seconds)
+        return time.monotonic() < (self.token_expiry - buffer_seconds)
 
     def get_headers(self) -> Dict[str, str]:
         """
         Get authentication headers for HTTP requests
 
+        The headers dict is built once per access token (checked by
+        identity) and reused until the token changes, so callers must not
+        mutate it.
+
         Returns:
             Dictionary with Authorization header
         """
         if not self.is_token_valid():
-            if self.refresh_token:
-                if self.logger:
-                    self.logger.log_auth(
-                        event="token_expired",
-                        client_id=self.client_id,
-                        access_token=self.access_token,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                    )
-                self.refresh_access_token()
-            else:
-                raise Exception("Token expired and no refresh token available")
+            with self._token_lock:
+                # Another thread may have refreshed while we waited
+                if not self.is_token_valid():
+                    if not self.refresh_token:
+                        raise Exception("Token expired and no refresh token available")
+                    if self.logger:
+                        self.logger.log_auth(
+                            event="token_expired",
+                            **self._log_context,
+                            access_token=self.access_token,
+                        )
+                    self.refresh_access_token()
+
+        token = self.access_token
+        headers_token, headers = self._cached_headers
+        if headers_token is not token:
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            }
+            self._cached_headers = (token, headers)
+        return headers
+
+    def warmup(self, timeout: float = 2.0) -> bool:
+        """
+        Open a pooled connection before the first real call
 
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        Sends a cheap public/test request so the TCP/TLS handshake is
+        already done (and the socket kept alive) when user code makes its
+        first call. Authenticating has the same effect, so this only
+        matters for sessions that have not authenticated yet.
+
+        Args:
+            timeout: Seconds to wait for the ping
+
+        Returns:
+            True if the ping succeeded (failures are ignored)
+        """
+        try:
+            response = self.session.get(self._test_url, timeout=timeout)
+            return response.status_code < 400
+        except Exception:
+            return False
 
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -520,23 +862,27 @@ class DeribitAuth:
         Returns:
             Account summary or error
         """
-        url = f"{self.base_url}/api/v2/private/get_account_summary"
         params = {"currency": "BTC", "extended": "true"}
 
-        response = self.session.get(url, params=params, headers=self.get_headers())
-        response.raise_for_status()
+        response = self.session.get(self._account_url, params=params, headers=self.get_headers())
+        if response.status_code >= 400:
+            self._handle_http_error(response)
 
-        result = response.json()
+        result = _json_loads(response.content)
 
         if "result" in result:
-            print(f"\nConnection test successful!")
-            print(f"  Currency: {result['result'].get('currency', 'N/A')}")
-            print(f"  Balance: {result['result'].get('balance', 'N/A')}")
+            if self.verbose:
+                print(f"\nConnection test successful!")
+                print(f"  Currency: {result['result'].get('currency', 'N/A')}")
+                print(f"  Balance: {result['result'].get('balance', 'N/A')}")
             return result["result"]
         else:
             raise Exception(f"Connection test failed: {result}")
 
 
+atexit.register(DeribitAuth.close_sessions)
+
+
 def main():
     """
     Example usage of DeribitAuth class
@@ -552,7 +898,7 @@ def main():
         print(f"Logging to: {logger.log_dir}")
 
     # Initialize auth (reads from environment variables)
-    auth = DeribitAuth(test_mode=True, logger=logger)
+    auth = DeribitAuth(test_mode=True, logger=logger, verbose=True)
 
     # Method 1: Client Credentials (simplest)
     print("\n[Method 1] Client Credentials Authentication")
@@ -570,7 +916,7 @@ def main():
     # Method 2: Client Signature (more secure)
     print("\n[Method 2] Client Signature Authentication")
     print("-" * 60)
-    auth2 = DeribitAuth(test_mode=True, logger=logger)
+    auth2 = DeribitAuth(test_mode=True, logger=logger, verbose=True)
     auth2.authenticate_signature(scope="trade:read_write session:signature_demo")
 
     # Method 3: Refresh Token
@@ -7,7 +7,9 @@ Provides structured JSON logging for three categories:
 - API logs:    ~/deribit/logs/api_YYYYMMDD.jsonl
 
 Each log entry is a single JSON line (JSONL format) for easy
-parsing by both humans and the future AuditAgent.
+parsing by both humans and the future AuditAgent. BinaryDeribitLogger
+writes the same entries as Arrow IPC streams (*.arrows, needs pyarrow)
+for columnar scanning.
 
 Sensitive data policy:
 - client_secret: NEVER logged
@@ -18,12 +20,121 @@ Sensitive data policy:
 
 import json
 import os
+import random
+import hashlib
 import time
-import uuid
+import itertools
+import sys
+import queue
+import atexit
 import threading
-from datetime import datetime, timezone
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+# Encoders for values JSON has no type for, looked up by exact type;
+# anything else falls back to str()
+_DEFAULT_ENCODERS = {
+    Decimal: float,
+    datetime: lambda d: d.isoformat(timespec="milliseconds"),
+    set: list,
+    frozenset: list,
+}
+
+
+def _default(obj: Any) -> Any:
+    return _DEFAULT_ENCODERS.get(type(obj), str)(obj)
+
+
+# Try to import orjson for faster log serialization (optional)
+try:
+    import orjson
+
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_line(entry: Dict[str, Any]) -> bytes:
+        # orjson appends the newline itself, without a second bytes copy
+        return orjson.dumps(
+            entry,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, default=_default, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(entry: Dict[str, Any]) -> bytes:
+        return (json.dumps(entry, default=_default, ensure_ascii=False) + "\n").encode("utf-8")
+
+    ORJSON_AVAILABLE = False
+
+# Try to import pyarrow for the binary (Arrow IPC) logger (optional)
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import zstandard for compressing rolled-over logs (optional)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+def _round_ms(latency_ms: float) -> float:
+    """Round a (non-negative) latency to 0.1 ms, half up, without round()"""
+    return int(latency_ms * 10.0 + 0.5) / 10
+
+
+# API log events whose responses are bulk data (instrument lists, book
+# depth, trade history); their raw payload is never embedded in api logs
+_BULK_API_EVENTS = frozenset({"get_instruments", "get_order_book", "get_user_trades"})
+
+
+def _order_summary(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary for order-placing actions (buy, sell, edit, close_position)"""
+    # Trade responses nest order info under 'order'
+    order = response.get("order", response)
+    return {
+        "order_id": order.get("order_id"),
+        "order_state": order.get("order_state"),
+        "direction": order.get("direction"),
+        "filled_amount": order.get("filled_amount"),
+        "average_price": order.get("average_price"),
+        "commission": order.get("commission"),
+        "raw_response": response,
+    }
+
+
+def _cancel_summary(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary for cancel, which returns the cancelled order itself"""
+    return {
+        "order_id": response.get("order_id"),
+        "order_state": response.get("order_state"),
+        "raw_response": response,
+    }
+
+
+def _raw_summary(response: Any) -> Dict[str, Any]:
+    """Summary for cancel_all, which returns only the number cancelled"""
+    return {"raw_response": response}
+
+
+# Response summary builder per trade action (others use _order_summary)
+_TRADE_SUMMARY_BUILDERS = {
+    "buy": _order_summary,
+    "sell": _order_summary,
+    "edit": _order_summary,
+    "close_position": _order_summary,
+    "cancel": _cancel_summary,
+    "cancel_all": _raw_summary,
+}
 
 
 class DeribitLogger:
@@ -36,46 +147,320 @@ class DeribitLogger:
     - api_YYYYMMDD.jsonl     (account queries, market data, position checks)
     """
 
-    def __init__(self, log_dir: Optional[str] = None):
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        flush_interval: float = 0.2,
+        compress_rolled: bool = False,
+        raw_max_bytes: int = 4096,
+        api_sample_rate: float = 1.0,
+        shard_hourly: bool = False,
+        max_queued: int = 0,
+    ):
         """
         Initialize the logger.
 
         Args:
             log_dir: Custom log directory. Defaults to ~/deribit/logs/
+            flush_interval: Max seconds a written entry may sit in the
+                            64 KiB file buffer before reaching disk
+            compress_rolled: Compress each day's (or hour's) file to
+                             .jsonl.zst in the background once it rolls over;
+                             entries arriving late for a rolled file go to
+                             the current one (requires: pip install zstandard)
+            raw_max_bytes: Largest serialized API response embedded in an
+                           api entry; bigger ones are logged by hash/size
+            api_sample_rate: Fraction of successful log_api calls to keep
+                             (errors are always logged; default: all)
+            shard_hourly: Write one file per UTC hour (<category>_YYYYMMDDHH)
+                          instead of per day, so readers can scan in parallel
+            max_queued: Cap on entries waiting for the writer thread; when
+                        full, logging calls block until it catches up
+                        (default: 0, unbounded)
         """
+        if compress_rolled and not ZSTD_AVAILABLE:
+            raise ImportError("compress_rolled=True requires zstandard: pip install zstandard")
+        self._compress_rolled = compress_rolled
+        self._raw_max_bytes = raw_max_bytes
+        self._api_sample_rate = api_sample_rate
+        # File stamp period in seconds and its strftime format
+        self._shard_seconds = 3600 if shard_hourly else 86400
+        self._shard_format = "%Y%m%d%H" if shard_hourly else "%Y%m%d"
+
         if log_dir:
             self.log_dir = Path(log_dir)
         else:
             self.log_dir = Path.home() / "deribit" / "logs"
 
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
 
-    def _today_stamp(self) -> str:
-        return datetime.now(timezone.utc).strftime("%Y%m%d")
+        # log_ids are a random per-logger prefix plus a counter: unique
+        # without an RNG draw per entry, and sortable within a run
+        self._id_prefix = os.urandom(6).hex()
+        self._id_counter = itertools.count()
+
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") and (shard number, file
+        # stamp): formatted once per second/shard instead of once per entry
+        self._iso_cache = (-1, "")
+        self._shard_cache = (-1, "")
+
+        # Serialized ',"context":{...}}' tails for api entries, keyed by
+        # (environment, base_url); these rarely change within a session
+        self._api_context_tails: Dict[Tuple[str, str], bytes] = {}
+
+        # Open append handle per category, as (filename, file); only the
+        # writer thread touches these, so no lock is needed
+        self._files: Dict[str, Tuple[str, BinaryIO]] = {}
+        # Filenames handed to the compressor (compress_rolled); never reopened
+        self._rolled: set = set()
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+        # Callers only enqueue encoded lines; a single writer thread drains
+        # them in batches, so logging never blocks on file I/O and per-file
+        # order is preserved. A bounded queue applies back-pressure instead
+        # of dropping audit entries; the unbounded SimpleQueue is cheaper.
+        if max_queued > 0:
+            self._queue: "queue.Queue" = queue.Queue(maxsize=max_queued)
+        else:
+            self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._drain, name="deribit-logger", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _file_stamp(self) -> str:
+        shard = int(time.time()) // self._shard_seconds
+        cached = self._shard_cache
+        if cached[0] != shard:
+            stamp = time.strftime(self._shard_format, time.gmtime(shard * self._shard_seconds))
+            cached = (shard, stamp)
+            self._shard_cache = cached
+        return cached[1]
 
     def _now_iso(self) -> str:
-        return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        now = time.time()
+        sec = int(now)
+        cached = self._iso_cache
+        if cached[0] != sec:
+            cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+            self._iso_cache = cached
+        return f"{cached[1]}.{int((now - sec) * 1000):03d}+00:00"
 
     def _new_log_id(self) -> str:
-        return str(uuid.uuid4())
+        return f"{self._id_prefix}{next(self._id_counter):010x}"
 
     def _write_entry(self, category: str, entry: Dict[str, Any]) -> None:
         """
-        Write a single JSONL entry to the appropriate log file.
+        Queue a single JSONL entry for the appropriate log file.
+
+        The file is chosen here (not by the writer thread) so an entry
+        always lands in the file for the day (or hour) it was logged.
 
         Args:
             category: Log category ('trades', 'auth', 'api')
             entry: The log entry dict
         """
-        filename = f"{category}_{self._today_stamp()}.jsonl"
-        filepath = self.log_dir / filename
+        self._write_line(category, _dumps_line(entry))
 
-        line = json.dumps(entry, default=str, ensure_ascii=False)
+    def _write_line(self, category: str, line: bytes) -> None:
+        """Queue an already-serialized JSONL line (including newline)"""
+        filename = f"{category}_{self._file_stamp()}.jsonl"
+        self._queue.put((category, filename, line))
 
-        with self._lock:
-            with open(filepath, "a") as f:
-                f.write(line + "\n")
+    def _write_api_entry(
+        self,
+        entry: Dict[str, Any],
+        environment: str,
+        base_url: str,
+        raw_response: Optional[bytes] = None,
+    ) -> None:
+        """Queue an api entry, adding its context field"""
+        # Splice in the cached context field instead of re-serializing it
+        if raw_response is None:
+            body = _dumps(entry)[:-1]
+        else:
+            # The raw response was already encoded to measure it: splice
+            # those bytes in too, keeping the response/error field order
+            response = entry.pop("response")
+            error = entry.pop("error")
+            body = (
+                _dumps(entry)[:-1]
+                + b',"response":{"result_count":%d,"raw_response":' % response["result_count"]
+                + raw_response
+                + b'},"error":'
+                + _dumps(error)
+            )
+        self._write_line("api", body + self._api_context_tail(environment, base_url))
+
+    def _api_context_tail(self, environment: str, base_url: str) -> bytes:
+        """Return the serialized closing context field for api entries"""
+        key = (environment, base_url)
+        tail = self._api_context_tails.get(key)
+        if tail is None:
+            context = _dumps({"environment": environment, "base_url": base_url})
+            tail = b',"context":' + context + b"}\n"
+            self._api_context_tails[key] = tail
+        return tail
+
+    # Upper bounds on one drained batch
+    _BATCH_MAX_ENTRIES = 512
+    _BATCH_MAX_BYTES = 1024 * 1024
+
+    def _drain(self) -> None:
+        """Writer thread: append queued lines, one write per file per batch"""
+        unflushed = False
+        while True:
+            try:
+                # While data sits in the file buffers, wake up to flush it
+                item = self._queue.get(timeout=self._flush_interval if unflushed else None)
+            except queue.Empty:
+                self._flush_files()
+                unflushed = False
+                continue
+            batch: Dict[Tuple[str, str], list] = {}
+            markers = []
+            stop = False
+            size = 0
+            count = 0
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    category, filename, line = item
+                    batch.setdefault((category, filename), []).append(line)
+                    size += len(line)
+                    count += 1
+                if stop or count >= self._BATCH_MAX_ENTRIES or size >= self._BATCH_MAX_BYTES:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            for (category, filename), lines in batch.items():
+                try:
+                    self._write_batch(category, filename, lines)
+                except OSError as e:
+                    # Keep the writer alive (flush()/close() wait on it)
+                    sys.stderr.write(f"DeribitLogger: failed to write {filename}: {e}\n")
+            unflushed = unflushed or bool(batch)
+
+            if unflushed and (
+                markers or stop
+                or time.monotonic() - self._last_flush >= self._flush_interval
+            ):
+                self._flush_files()
+                unflushed = False
+
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, category: str, filename: str, lines: list) -> None:
+        """Writer thread: append one batch of queued items to a log file"""
+        # Lines go straight into the 64 KiB file buffer; no joined copy of
+        # the whole batch is built first
+        self._file_for(category, filename).writelines(lines)
+
+    def _file_for(self, category: str, filename: str) -> BinaryIO:
+        """Return the open append handle for a category, rolling over by date"""
+        current = self._files.get(category)
+        if current is not None and current[0] == filename:
+            return current[1]
+        if current is not None and filename in self._rolled:
+            # Late entry for a shard that is being (or has been) compressed
+            # and unlinked: append it to the current shard instead
+            return current[1]
+        if current is not None:
+            current[1].close()
+            # Only a move forward in time means the old file is finished;
+            # from here on the writer never opens it again
+            if self._compress_rolled and current[0] < filename:
+                self._rolled.add(current[0])
+                threading.Thread(
+                    target=self._compress,
+                    args=(self.log_dir / current[0],),
+                    name="deribit-logger-zstd",
+                    daemon=True,
+                ).start()
+        f = open(self.log_dir / filename, "ab", buffering=64 * 1024)
+        self._files[category] = (filename, f)
+        return f
+
+    @staticmethod
+    def _compress(path: Path) -> None:
+        """
+        Compress a finished log file to <name>.zst and remove the original.
+
+        Output goes to a temporary file first, so an interrupted run never
+        leaves a truncated archive. If the archive already exists (an
+        earlier run rolled the same shard), the new frame is appended; zstd
+        decodes concatenated frames as one stream.
+        """
+        target = path.with_name(path.name + ".zst")
+        tmp = path.with_name(path.name + ".zst.tmp")
+        try:
+            with open(path, "rb") as src, open(tmp, "wb") as dst:
+                zstandard.ZstdCompressor(level=10).copy_stream(src, dst)
+            if target.exists():
+                with open(tmp, "rb") as src, open(target, "ab") as dst:
+                    dst.write(src.read())
+                tmp.unlink()
+            else:
+                os.replace(tmp, target)
+            path.unlink()
+        except OSError as e:
+            sys.stderr.write(f"DeribitLogger: failed to compress {path.name}: {e}\n")
+
+    def _flush_files(self) -> None:
+        """Flush every open log file buffer to the OS"""
+        for filename, f in self._files.values():
+            try:
+                f.flush()
+            except OSError as e:
+                sys.stderr.write(f"DeribitLogger: failed to flush {filename}: {e}\n")
+        self._last_flush = time.monotonic()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every entry logged so far has been written and flushed.
+
+        Useful from shutdown/SIGTERM handlers; close() does this too.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all entries were written within the timeout
+        """
+        if self._closed:
+            return True
+        marker = threading.Event()
+        self._queue.put(marker)
+        return marker.wait(timeout)
+
+    def close(self) -> None:
+        """
+        Write any queued entries and stop the writer thread.
+
+        Called automatically at interpreter exit. Entries logged after
+        close() are dropped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        for _, f in self._files.values():
+            f.close()
+        self._files.clear()
+        atexit.unregister(self.close)
 
     @staticmethod
     def mask_client_id(client_id: Optional[str]) -> Optional[str]:
@@ -123,31 +508,20 @@ class DeribitLogger:
             The log_id for this entry
         """
         log_id = self._new_log_id()
-        status = "error" if error else "success"
-
-        # Extract key response fields if available
-        response_summary = None
-        if response:
-            # Trade responses nest order info under 'order'
-            order = response.get("order", response)
-            response_summary = {
-                "order_id": order.get("order_id"),
-                "order_state": order.get("order_state"),
-                "direction": order.get("direction"),
-                "filled_amount": order.get("filled_amount"),
-                "average_price": order.get("average_price"),
-                "commission": order.get("commission"),
-                "raw_response": response,
-            }
 
+        # Built as one literal; the response summary (key fields for this
+        # action) comes straight from its builder
         entry = {
             "timestamp": self._now_iso(),
             "log_id": log_id,
             "action": action,
-            "status": status,
-            "latency_ms": round(latency_ms, 1),
+            "status": "error" if error else "success",
+            "latency_ms": _round_ms(latency_ms),
             "request": request_params,
-            "response": response_summary,
+            "response": (
+                _TRADE_SUMMARY_BUILDERS.get(action, _order_summary)(response)
+                if response else None
+            ),
             "error": error,
             "context": {
                 "environment": environment,
@@ -206,27 +580,35 @@ class DeribitLogger:
         """
         log_id = self._new_log_id()
 
+        # Most auth events fill only a few of these fields (session_start
+        # has no scope/token yet), so unset ones are left out entirely.
+        # Masking is inlined (same rules as mask_client_id/mask_token).
+        auth = {
+            k: v for k, v in (
+                ("method", method),
+                ("client_id", (client_id[:4] + "****" if len(client_id) > 4 else "****")
+                              if client_id else None),
+                ("scope_requested", scope_requested),
+                ("scope_granted", scope_granted),
+                ("token_expires_in", token_expires_in),
+                ("token_prefix", access_token[:10] + "..." if access_token else None),
+            ) if v is not None
+        }
+        context = {"environment": environment, "base_url": base_url}
+        if api_method is not None:
+            context["api_method"] = api_method
+        if credentials_source is not None:
+            context["credentials_source"] = credentials_source
+
         entry = {
             "timestamp": self._now_iso(),
             "log_id": log_id,
             "event": event,
             "status": status,
-            "latency_ms": round(latency_ms, 1),
-            "auth": {
-                "method": method,
-                "client_id": self.mask_client_id(client_id),
-                "scope_requested": scope_requested,
-                "scope_granted": scope_granted,
-                "token_expires_in": token_expires_in,
-                "token_prefix": self.mask_token(access_token),
-            },
+            "latency_ms": _round_ms(latency_ms),
+            "auth": auth,
             "error": error,
-            "context": {
-                "environment": environment,
-                "base_url": base_url,
-                "api_method": api_method,
-                "credentials_source": credentials_source,
-            },
+            "context": context,
         }
 
         self._write_entry("auth", entry)
@@ -264,46 +646,52 @@ class DeribitLogger:
             base_url: Deribit base URL
 
         Returns:
-            The log_id for this entry
+            The log_id for this entry ("" if it was sampled out)
         """
-        log_id = self._new_log_id()
-        status = "error" if error else "success"
+        # Sample before any id/timestamp/serialization work is done
+        if not error and self._api_sample_rate < 1.0 and random.random() >= self._api_sample_rate:
+            return ""
 
-        response_summary = None
+        log_id = self._new_log_id()
+        summary = raw_response = None
         if response:
-            # For list responses, include count
-            if isinstance(response, list):
-                response_summary = {
-                    "result_count": len(response),
-                    "raw_response": response,
-                }
-            else:
-                response_summary = {
-                    "result_count": 1,
-                    "raw_response": response,
-                }
+            summary, raw_response = self._api_response_summary(event, response)
 
         entry = {
             "timestamp": self._now_iso(),
             "log_id": log_id,
             "event": event,
-            "status": status,
-            "latency_ms": round(latency_ms, 1),
-            "request": {
-                "api_method": api_method,
-                "params": request_params,
-            },
-            "response": response_summary,
+            "status": "error" if error else "success",
+            "latency_ms": _round_ms(latency_ms),
+            "request": {"api_method": api_method, "params": request_params},
+            "response": summary,
             "error": error,
-            "context": {
-                "environment": environment,
-                "base_url": base_url,
-            },
         }
 
-        self._write_entry("api", entry)
+        self._write_api_entry(entry, environment, base_url, raw_response)
         return log_id
 
+    def _api_response_summary(self, event: str, response: Any) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """
+        Build the response field of an api entry
+
+        Returns:
+            Tuple of (response field, encoded response if it is logged
+            inline, else None)
+        """
+        # For list responses, include count
+        count = len(response) if isinstance(response, list) else 1
+        # Bulk and oversized payloads are replaced by a short hash and
+        # their size instead of being re-encoded into every line
+        raw = _dumps(response)
+        if event not in _BULK_API_EVENTS and len(raw) <= self._raw_max_bytes:
+            return {"result_count": count, "raw_response": response}, raw
+        return {
+            "result_count": count,
+            "raw_response_sha": hashlib.blake2b(raw, digest_size=8).hexdigest(),
+            "raw_response_bytes": len(raw),
+        }, None
+
     # =================================================================
     # ERROR HELPERS
     # =================================================================
@@ -335,3 +723,180 @@ class DeribitLogger:
             "http_status": http_status,
         }
         return error_dict
+
+
+# Nested fields stored as JSON text columns in the binary logger, per category
+_ARROW_JSON_COLUMNS = {
+    "trades": ("request", "response", "error", "context"),
+    "auth": ("auth", "error", "context"),
+    "api": ("request", "response", "error", "context"),
+}
+
+
+class BinaryDeribitLogger(DeribitLogger):
+    """
+    DeribitLogger variant that writes Arrow IPC streams instead of JSONL.
+
+    Same API and log_ids as DeribitLogger; each category goes to
+    <category>_YYYYMMDD_<logger id>.arrows with typed columns
+    (timestamp, log_id, action/event, status, latency_ms) plus the nested
+    fields as JSON text. Read with pyarrow.ipc.open_stream, DuckDB or
+    Polars. Use DeribitLogger when logs are meant to be read by humans.
+
+    Requires: pip install pyarrow
+    """
+
+    # Rows buffered per category before a record batch is written
+    _ROWS_PER_BATCH = 8192
+
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        flush_interval: float = 1.0,
+        raw_max_bytes: int = 4096,
+        api_sample_rate: float = 1.0,
+        shard_hourly: bool = False,
+        max_queued: int = 0,
+    ):
+        """
+        Initialize the binary logger.
+
+        Args:
+            log_dir: Custom log directory. Defaults to ~/deribit/logs/
+            flush_interval: Max seconds rows are buffered before being
+                            written out as a record batch
+            raw_max_bytes: Largest serialized API response embedded in an
+                           api entry; bigger ones are logged by hash/size
+            api_sample_rate: Fraction of successful log_api calls to keep
+                             (errors are always logged; default: all)
+            shard_hourly: Write one file per UTC hour (<category>_YYYYMMDDHH)
+                          instead of per day, so readers can scan in parallel
+            max_queued: Cap on entries waiting for the writer thread; when
+                        full, logging calls block until it catches up
+                        (default: 0, unbounded)
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("BinaryDeribitLogger requires pyarrow: pip install pyarrow")
+
+        self._schemas = {
+            category: pa.schema(
+                [
+                    ("timestamp", pa.timestamp("ms", tz="UTC")),
+                    ("log_id", pa.string()),
+                    ("action" if category == "trades" else "event", pa.string()),
+                    ("status", pa.string()),
+                    ("latency_ms", pa.float64()),
+                ]
+                + [(column, pa.string()) for column in json_columns]
+            )
+            for category, json_columns in _ARROW_JSON_COLUMNS.items()
+        }
+        # Per category: (filename, sink, stream writer) and pending rows;
+        # only the writer thread touches these
+        self._streams: Dict[str, Tuple[str, Any, Any]] = {}
+        self._rows: Dict[str, list] = {}
+
+        super().__init__(
+            log_dir=log_dir,
+            flush_interval=flush_interval,
+            raw_max_bytes=raw_max_bytes,
+            api_sample_rate=api_sample_rate,
+            shard_hourly=shard_hourly,
+            max_queued=max_queued,
+        )
+
+    def _write_entry(self, category: str, entry: Dict[str, Any]) -> None:
+        """
+        Queue a single entry as a row for the category's Arrow stream.
+
+        Nested fields are serialized here, so later changes to the
+        caller's dicts cannot leak into the log.
+
+        Args:
+            category: Log category ('trades', 'auth', 'api')
+            entry: The log entry dict
+        """
+        row = (
+            entry["timestamp"],
+            entry["log_id"],
+            entry["action" if category == "trades" else "event"],
+            entry["status"],
+            entry["latency_ms"],
+        ) + tuple(
+            None if entry.get(column) is None else _dumps(entry[column]).decode("utf-8")
+            for column in _ARROW_JSON_COLUMNS[category]
+        )
+        filename = f"{category}_{self._file_stamp()}_{self._id_prefix}.arrows"
+        self._queue.put((category, filename, row))
+
+    def _write_api_entry(
+        self,
+        entry: Dict[str, Any],
+        environment: str,
+        base_url: str,
+        raw_response: Optional[bytes] = None,
+    ) -> None:
+        entry["context"] = {"environment": environment, "base_url": base_url}
+        self._write_entry("api", entry)
+
+    def _write_batch(self, category: str, filename: str, rows: list) -> None:
+        current = self._streams.get(category)
+        # An Arrow stream cannot be reopened for appending, so rows logged
+        # just before a rollover that arrive after it stay in the new file
+        if current is None or current[0] < filename:
+            self._write_rows(category)
+            self._close_stream(category)
+            sink = pa.OSFile(str(self.log_dir / filename), "wb")
+            writer = pa.ipc.new_stream(sink, self._schemas[category])
+            self._streams[category] = (filename, sink, writer)
+
+        pending = self._rows.setdefault(category, [])
+        pending.extend(rows)
+        if len(pending) >= self._ROWS_PER_BATCH:
+            self._write_rows(category)
+
+    def _write_rows(self, category: str) -> None:
+        """Write a category's pending rows to its stream as one record batch"""
+        rows = self._rows.pop(category, None)
+        if not rows:
+            return
+        schema = self._schemas[category]
+        columns = list(zip(*rows))
+        try:
+            columns[0] = [datetime.fromisoformat(ts) for ts in columns[0]]
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            )
+            self._streams[category][2].write_batch(batch)
+        except Exception as e:
+            # Keep the writer alive (flush()/close() wait on it)
+            sys.stderr.write(f"BinaryDeribitLogger: dropped {len(rows)} {category} rows: {e}\n")
+
+    def _close_stream(self, category: str) -> None:
+        current = self._streams.pop(category, None)
+        if current is not None:
+            current[2].close()
+            current[1].close()
+
+    def _flush_files(self) -> None:
+        for category in list(self._rows):
+            self._write_rows(category)
+        for filename, sink, _ in self._streams.values():
+            try:
+                sink.flush()
+            except OSError as e:
+                sys.stderr.write(f"BinaryDeribitLogger: failed to flush {filename}: {e}\n")
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Write any buffered rows, close the Arrow streams and stop the writer.
+
+        Called automatically at interpreter exit.
+        """
+        if self._closed:
+            return
+        super().close()
+        for category in list(self._streams):
+            self._close_stream(category)
@@ -14,10 +14,20 @@ Author: API Developer
 Environment: Deribit Test (test.deribit.com)
 """
 
+import contextlib
+import glob
+import io
+import os
+import sys
 import time
-import requests
-from typing import Dict, Any, List, Optional
-from deribit_auth import DeribitAuth
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import quote
+from deribit_auth import DeribitAuth, _json_dumps, _json_loads
+
+if TYPE_CHECKING:
+    from deribit_ws import DeribitWSTransport
 
 try:
     from deribit_logger import DeribitLogger
@@ -25,6 +35,20 @@ try:
 except ImportError:
     LOGGER_AVAILABLE = False
 
+# Try to import numpy for array order books (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import ijson for streaming large responses (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # API methods that are trade actions (logged to trades_*.jsonl)
 _TRADE_METHODS = {
     "private/buy",
@@ -63,8 +87,133 @@ _TRADE_ACTION_NAMES = {
     "private/cancel_all_by_instrument": "cancel_all",
 }
 
+# One lookup per call: method -> (is_trade, name used in the log entry)
+_METHOD_INFO = {m: (False, name) for m, name in _API_EVENT_NAMES.items()}
+_METHOD_INFO.update({m: (True, _TRADE_ACTION_NAMES.get(m, m)) for m in _TRADE_METHODS})
+
+# Reference-data reads served from the cache (see DeribitTrader.cache_ttl);
+# only public ones are ever written to disk
+_CACHEABLE_METHODS = frozenset({"public/get_instruments", "private/get_subaccounts"})
+
+# Cache miss marker (None is a valid API result)
+_MISS = object()
+
+
+def _order_params(
+    instrument_name: str,
+    amount: float,
+    order_type: str,
+    price: Optional[float],
+    post_only: bool,
+    reduce_only: bool,
+    label: Optional[str],
+) -> Dict[str, Any]:
+    """Build buy/sell params, leaving out unset optional fields"""
+    params: Dict[str, Any] = {
+        "instrument_name": instrument_name,
+        "amount": amount,
+        "type": order_type,
+    }
+    if price is not None:
+        params["price"] = price
+    if post_only:
+        params["post_only"] = True
+    if reduce_only:
+        params["reduce_only"] = True
+    if label:
+        params["label"] = label
+    return params
+
+
+class _SingleFlight:
+    """
+    Collapse identical concurrent calls into one
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait for and share its result (or exception).
+    """
+
+    __slots__ = ("_calls", "_lock")
+
+    def __init__(self):
+        self._calls: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if leader:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+        return future.result()
+
+
+class _CallLogMixin:
+    """
+    trades_/api_ log routing shared by DeribitTrader and AsyncDeribitTrader
+
+    Expects logger, _environment and base_url attributes on the instance.
+    """
+
+    __slots__ = ()
+
+    def _log_call(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        latency_ms: float,
+        response: Any = None,
+        error: Any = None,
+        route: Optional[Tuple[bool, str]] = None,
+    ) -> None:
+        """
+        Log one API call to trades_*.jsonl or api_*.jsonl (no-op without a logger)
+
+        Args:
+            method: API method name (e.g., 'private/buy')
+            params: Request parameters
+            latency_ms: Round-trip time
+            response: API result (on success)
+            error: Error details dict (on failure)
+            route: (is_trade, log_name) for method, if already looked up
+        """
+        if self.logger is None:
+            return
+        is_trade, log_name = route or _METHOD_INFO.get(method, (False, method))
+        if is_trade:
+            self.logger.log_trade(
+                action=log_name,
+                request_params=params,
+                api_method=method,
+                response=response,
+                error=error,
+                latency_ms=latency_ms,
+                environment=self._environment,
+                base_url=self.base_url,
+            )
+        else:
+            self.logger.log_api(
+                event="api_error" if error else log_name,
+                api_method=method,
+                request_params=params,
+                response=response,
+                error=error,
+                latency_ms=latency_ms,
+                environment=self._environment,
+                base_url=self.base_url,
+            )
 
-class DeribitTrader:
+
+class DeribitTrader(_CallLogMixin):
     """
     Deribit Trading Interface
 
@@ -72,17 +221,78 @@ class DeribitTrader:
     All operations are logged when a DeribitLogger is available via auth.logger.
     """
 
-    def __init__(self, auth: DeribitAuth):
+    # Fixed attribute set: no per-instance __dict__, cheaper attribute access
+    __slots__ = (
+        "auth",
+        "transport",
+        "base_url",
+        "logger",
+        "_environment",
+        "_batch_url",
+        "_routes",
+        "_cache_ttl",
+        "_cache",
+        "_cache_lock",
+        "_cache_dir",
+        "_inflight",
+    )
+
+    # Most entries the reference-data cache holds before evicting the oldest
+    _CACHE_MAX_ENTRIES = 32
+
+    def __init__(
+        self,
+        auth: DeribitAuth,
+        transport: Optional["DeribitWSTransport"] = None,
+        cache_ttl: float = 300.0,
+        warmup: bool = False,
+        cache_dir: Union[bool, str] = False,
+    ):
         """
         Initialize trader with authentication
 
         Args:
             auth: Authenticated DeribitAuth instance
+            transport: Optional DeribitWSTransport; calls are then sent over
+                       its persistent WebSocket, falling back to HTTPS while
+                       the socket cannot be opened
+            cache_ttl: Seconds get_instruments()/get_subaccounts() results
+                       are reused before being fetched again (0 disables)
+            warmup: Open the HTTPS connection in a background thread now,
+                    so the first call skips the handshake (useful when
+                    auth has not been used yet, e.g. public-only access)
+            cache_dir: Also keep cached public results (get_instruments) on
+                       disk for cache_ttl seconds, so a new process starts
+                       warm (True for ~/.cache/deribit, or a directory)
         """
         self.auth = auth
+        self.transport = transport
         self.base_url = auth.base_url
         self.logger = getattr(auth, "logger", None)
         self._environment = getattr(auth, "_environment", "test")
+        self._batch_url = f"{self.base_url}/api/v2"
+        # Everything _make_request needs per known method, resolved once:
+        # method -> (url, is_trade, log_name, is_private)
+        self._routes = {
+            method: (f"{self._batch_url}/{method}", is_trade, log_name, method.startswith("private/"))
+            for method, (is_trade, log_name) in _METHOD_INFO.items()
+        }
+
+        # Reference data that rarely changes: key -> (expiry, JSON-encoded
+        # result). Kept encoded so every hit decodes a private copy that
+        # callers can modify without corrupting the cache.
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[Tuple, Tuple[float, bytes]] = {}
+        self._cache_lock = threading.Lock()
+        if cache_dir is True:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "deribit")
+        self._cache_dir = cache_dir or None
+        # Identical concurrent reads (same ticker, same cold cache entry)
+        # share one request
+        self._inflight = _SingleFlight()
+
+        if warmup:
+            threading.Thread(target=auth.warmup, name="deribit-warmup", daemon=True).start()
 
     def _make_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -98,9 +308,12 @@ class DeribitTrader:
         Returns:
             API response result
         """
-        url = f"{self.base_url}/api/v2/{method}"
-        headers = self.auth.get_headers() if method.startswith("private/") else {}
-        is_trade = method in _TRADE_METHODS
+        route = self._routes.get(method)
+        if route is None:
+            route = (f"{self._batch_url}/{method}", False, method, method.startswith("private/"))
+        url, is_trade, log_name, is_private = route
+        # Without a logger, every log site below is a single identity check
+        logger = self.logger
 
         # Deribit expects lowercase "true"/"false" for booleans in query params.
         # Python's requests library serializes True as "True" (capital T) which
@@ -112,139 +325,300 @@ class DeribitTrader:
             else:
                 sanitized_params[k] = v
 
-        start_time = time.time()
+        transport = self.transport
+        if transport is not None:
+            try:
+                transport.connect()
+            except Exception:
+                transport = None  # WebSocket unavailable, use HTTPS
+        if transport is None and is_private:
+            headers = self.auth.get_headers()
+        else:
+            headers = None
+
+        start_ns = time.perf_counter_ns()
         try:
-            response = self.auth.session.get(
-                url,
-                params=sanitized_params,
-                headers=headers
+            if transport is not None:
+                result = transport.request(method, params)
+                http_status = None
+            else:
+                response = self.auth.session.get(
+                    url,
+                    params=sanitized_params,
+                    headers=headers
+                )
+                if response.status_code >= 400:
+                    DeribitAuth._handle_http_error(response)
+                result = _json_loads(response.content)
+                http_status = response.status_code
+        except Exception as e:
+            # Network/HTTP errors and undecodable bodies
+            if logger is not None:
+                self._log_call(
+                    method, params, (time.perf_counter_ns() - start_ns) / 1_000_000,
+                    error=DeribitLogger.format_error(
+                        exception=e,
+                        http_status=getattr(getattr(e, "response", None), "status_code", None),
+                    ),
+                    route=(is_trade, log_name),
+                )
+            raise
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        if "result" in result:
+            api_result = result["result"]
+            if logger is not None:
+                self._log_call(method, params, latency_ms, response=api_result, route=(is_trade, log_name))
+            return api_result
+
+        error_code = error_message = None
+        if "error" in result:
+            api_error = result["error"]
+            error = Exception(f"API Error: {api_error}")
+            if isinstance(api_error, dict):
+                error_code = api_error.get("code")
+                error_message = api_error.get("message")
+            else:
+                error_message = str(api_error)
+        else:
+            error = Exception(f"Unexpected response: {result}")
+
+        if logger is not None:
+            self._log_call(
+                method, params, latency_ms,
+                error=DeribitLogger.format_error(
+                    exception=error,
+                    error_code=error_code,
+                    error_message=error_message,
+                    http_status=http_status,
+                ),
+                route=(is_trade, log_name),
             )
-            response.raise_for_status()
-            latency_ms = (time.time() - start_time) * 1000
+        raise error
+
+    def _cached_request(self, method: str, params: Dict[str, Any]) -> Any:
+        """_make_request, reusing a result younger than cache_ttl"""
+        if self._cache_ttl <= 0:
+            return self._make_request(method, params)
+
+        result = self._cache_get(method, params)
+        if result is _MISS:
+            # Callers sharing one in-flight fetch each decode their own copy
+            result = _json_loads(self._inflight.do(
+                (method, *sorted(params.items())),
+                lambda: self._fetch_and_cache(method, params),
+            ))
+        return result
+
+    def _fetch_and_cache(self, method: str, params: Dict[str, Any]) -> bytes:
+        """_make_request, storing the result in the cache; returns it encoded"""
+        return self._cache_put(method, params, self._make_request(method, params))
+
+    def _cache_get(self, method: str, params: Dict[str, Any]) -> Any:
+        """Fresh copy of the cached result for (method, params), or _MISS"""
+        # Sorted, so batch() calls hit regardless of parameter order
+        key = (method, *sorted(params.items()))
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return _json_loads(hit[1])
+
+        if self._cache_dir is None or not method.startswith("public/"):
+            return _MISS
+        path = self._cache_file(method, params)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age >= self._cache_ttl:
+                return _MISS
+            with open(path, "rb") as f:
+                raw = f.read()
+            result = _json_loads(raw)
+        except (OSError, ValueError):
+            return _MISS
+        self._cache_store(key, now + self._cache_ttl - age, raw)
+        return result
+
+    def _cache_put(self, method: str, params: Dict[str, Any], result: Any) -> bytes:
+        """Cache a fresh result in memory (and on disk for public methods); returns it encoded"""
+        key = (method, *sorted(params.items()))
+        raw = _json_dumps(result)
+        self._cache_store(key, time.monotonic() + self._cache_ttl, raw)
+
+        if self._cache_dir is None or not method.startswith("public/"):
+            return raw
+        path = self._cache_file(method, params)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk copy is only an optimization
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+        return raw
+
+    def _cache_store(self, key: Tuple, expiry: float, raw: bytes) -> None:
+        """Insert an encoded result into the in-memory cache, evicting the oldest entry when full"""
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (expiry, raw)
+
+    def _cache_file(self, method: str, params: Dict[str, Any]) -> str:
+        """Disk cache path, e.g. get_instruments_test_BTC_False_future.json"""
+        parts = [method.partition("/")[2], self._environment]
+        parts.extend(str(value) for _, value in sorted(params.items()))
+        return os.path.join(self._cache_dir, "_".join(parts).replace(os.sep, "-") + ".json")
+
+    def clear_cache(self) -> None:
+        """Drop cached instruments/subaccounts so the next call refetches
+
+        Files written under cache_dir for this environment are removed too.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+        if self._cache_dir is not None:
+            for method in _CACHEABLE_METHODS:
+                if method.startswith("public/"):
+                    pattern = f"{method.partition('/')[2]}_{self._environment}_*.json"
+                    for path in glob.glob(os.path.join(glob.escape(self._cache_dir), pattern)):
+                        with contextlib.suppress(OSError):
+                            os.unlink(path)
+
+    def batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send several API calls as one JSON-RPC batch (a single round-trip).
 
-            result = response.json()
+        Useful for independent reads (account, market data, positions) that
+        would otherwise be made one after another. Each call is logged
+        individually, like a _make_request call. Cacheable reads
+        (get_instruments/get_subaccounts) are answered from the cache
+        when possible and left out of the request. If the endpoint does not
+        answer with a JSON array, the calls are repeated individually.
 
-            if "result" in result:
-                api_result = result["result"]
-
-                # Log success
-                if self.logger:
-                    if is_trade:
-                        self.logger.log_trade(
-                            action=_TRADE_ACTION_NAMES.get(method, method),
-                            request_params=params,
-                            api_method=method,
-                            response=api_result,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-                    else:
-                        self.logger.log_api(
-                            event=_API_EVENT_NAMES.get(method, method),
-                            api_method=method,
-                            request_params=params,
-                            response=api_result,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-
-                return api_result
-
-            elif "error" in result:
-                api_error = result["error"]
-                error = Exception(f"API Error: {api_error}")
-
-                # Log API error
-                if self.logger:
-                    error_dict = DeribitLogger.format_error(
-                        exception=error,
-                        error_code=api_error.get("code") if isinstance(api_error, dict) else None,
-                        error_message=api_error.get("message") if isinstance(api_error, dict) else str(api_error),
-                        http_status=response.status_code,
-                    )
-                    if is_trade:
-                        self.logger.log_trade(
-                            action=_TRADE_ACTION_NAMES.get(method, method),
-                            request_params=params,
-                            api_method=method,
-                            error=error_dict,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-                    else:
-                        self.logger.log_api(
-                            event="api_error",
-                            api_method=method,
-                            request_params=params,
-                            error=error_dict,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-
-                raise error
-            else:
-                error = Exception(f"Unexpected response: {result}")
-                if self.logger:
-                    error_dict = DeribitLogger.format_error(
-                        exception=error,
-                        http_status=response.status_code,
-                    )
-                    if is_trade:
-                        self.logger.log_trade(
-                            action=_TRADE_ACTION_NAMES.get(method, method),
-                            request_params=params,
-                            api_method=method,
-                            error=error_dict,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-                    else:
-                        self.logger.log_api(
-                            event="api_error",
-                            api_method=method,
-                            request_params=params,
-                            error=error_dict,
-                            latency_ms=latency_ms,
-                            environment=self._environment,
-                            base_url=self.base_url,
-                        )
-                raise error
+        Args:
+            calls: (method, params) pairs, e.g.
+                   [("public/ticker", {"instrument_name": "BTC-PERPETUAL"})]
+            return_exceptions: Put failed calls in the result list as
+                               Exception objects instead of raising the first
 
+        Returns:
+            Results in the same order as calls
+        """
+        cached: Dict[int, Any] = {}
+        if self._cache_ttl > 0:
+            for i, (method, params) in enumerate(calls):
+                if method in _CACHEABLE_METHODS:
+                    hit = self._cache_get(method, params)
+                    if hit is not _MISS:
+                        cached[i] = hit
+            if len(cached) == len(calls):
+                return [cached[i] for i in range(len(calls))]
+
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+            if i not in cached
+        ]
+        # One Authorization header covers the whole batch
+        private = any(call["method"].startswith("private/") for call in payload)
+        headers = self.auth.get_headers() if private else {}
+
+        start_ns = time.perf_counter_ns()
+        try:
+            # Encoded with orjson when available; the shared session already
+            # sends Content-Type: application/json
+            body = _json_dumps(payload)
+            if self.auth.http2:
+                response = self.auth.session.post(self._batch_url, content=body, headers=headers)
+            else:
+                response = self.auth.session.post(self._batch_url, data=body, headers=headers)
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
-            # Log network/HTTP errors (only if not already logged above)
-            if self.logger and not str(e).startswith(("API Error:", "Unexpected response:")):
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            if self.logger is not None:
                 http_status = getattr(getattr(e, "response", None), "status_code", None)
-                error_dict = DeribitLogger.format_error(
-                    exception=e,
-                    http_status=http_status,
-                )
-                if is_trade:
-                    self.logger.log_trade(
-                        action=_TRADE_ACTION_NAMES.get(method, method),
-                        request_params=params,
-                        api_method=method,
-                        error=error_dict,
-                        latency_ms=latency_ms,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                    )
-                else:
-                    self.logger.log_api(
-                        event="api_error",
-                        api_method=method,
-                        request_params=params,
-                        error=error_dict,
-                        latency_ms=latency_ms,
-                        environment=self._environment,
-                        base_url=self.base_url,
-                    )
+                error_dict = DeribitLogger.format_error(exception=e, http_status=http_status)
+                for call in payload:
+                    self._log_call(call["method"], call["params"], latency_ms, error=error_dict)
             raise
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        try:
+            replies = _json_loads(response.content)
+        except ValueError:
+            replies = None
+        if not isinstance(replies, list):
+            # The endpoint rejected the batch (a single error object, an
+            # HTTP error page, ...): repeat the calls one by one instead
+            return self._batch_fallback(calls, cached, return_exceptions)
+        by_id = {reply.get("id"): reply for reply in replies if isinstance(reply, dict)}
+
+        results: List[Any] = []
+        first_error = None
+        for i, (method, params) in enumerate(calls):
+            if i in cached:
+                results.append(cached[i])
+                continue
+            reply = by_id.get(i, {})
+            if "result" in reply:
+                self._log_call(method, params, latency_ms, response=reply["result"])
+                if method in _CACHEABLE_METHODS and self._cache_ttl > 0:
+                    self._cache_put(method, params, reply["result"])
+                results.append(reply["result"])
+                continue
+
+            api_error = reply.get("error", reply)
+            error = Exception(f"API Error: {api_error}")
+            if self.logger is not None:
+                self._log_call(method, params, latency_ms, error=DeribitLogger.format_error(
+                    exception=error,
+                    error_code=api_error.get("code") if isinstance(api_error, dict) else None,
+                    error_message=api_error.get("message") if isinstance(api_error, dict) else str(api_error),
+                    http_status=response.status_code,
+                ))
+            results.append(error)
+            if first_error is None:
+                first_error = error
+
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return results
+
+    def _batch_fallback(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        cached: Dict[int, Any],
+        return_exceptions: bool,
+    ) -> List[Any]:
+        """batch() as individual _make_request calls, issued concurrently"""
+        pending = [i for i in range(len(calls)) if i not in cached]
+        results: List[Any] = [cached.get(i) for i in range(len(calls))]
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {
+                i: pool.submit(self._cached_request, *calls[i])
+                for i in pending
+            }
+        first_error = None
+        for i, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[i] = future.result()
+                continue
+            results[i] = error
+            if first_error is None:
+                first_error = error
+
+        if first_error is not None and not return_exceptions:
+            raise first_error
+        return results
 
     # =================================================================
     # ACCOUNT INFORMATION
@@ -287,10 +661,12 @@ class DeribitTrader:
         """
         Get list of subaccounts
 
+        Cached for cache_ttl seconds (see clear_cache()).
+
         Returns:
             List of subaccounts
         """
-        return self._make_request("private/get_subaccounts", {})
+        return self._cached_request("private/get_subaccounts", {})
 
     # =================================================================
     # MARKET DATA
@@ -301,6 +677,10 @@ class DeribitTrader:
         """
         Get available instruments
 
+        Cached per (currency, kind, expired) for cache_ttl seconds, as the
+        instrument list only changes on listings and expiries (see
+        clear_cache()).
+
         Args:
             currency: Currency (BTC, ETH, etc.)
             kind: Instrument kind (future, option, spot)
@@ -313,7 +693,72 @@ class DeribitTrader:
         if kind:
             params["kind"] = kind
 
-        return self._make_request("public/get_instruments", params)
+        return self._cached_request("public/get_instruments", params)
+
+    def count_instruments(self, currency: str = "BTC", kind: Optional[str] = None,
+                          expired: bool = False) -> int:
+        """
+        Count available instruments without building the instrument list
+
+        A cached get_instruments() result is counted directly. Otherwise,
+        with ijson installed (and the requests transport), the response is
+        parsed as a stream and only the array items are counted, so memory
+        stays constant however long the list is. Without ijson this is
+        len(get_instruments(...)).
+
+        Args:
+            currency: Currency (BTC, ETH, etc.)
+            kind: Instrument kind (future, option, spot)
+            expired: Include expired instruments
+
+        Returns:
+            Number of instruments
+        """
+        params = {"currency": currency, "expired": expired}
+        if kind:
+            params["kind"] = kind
+
+        if self._cache_ttl > 0:
+            hit = self._cache_get("public/get_instruments", params)
+            if hit is not _MISS:
+                return len(hit)
+        if not IJSON_AVAILABLE or self.auth.http2:
+            return len(self.get_instruments(currency, kind, expired))
+
+        method = "public/get_instruments"
+        # Lowercase booleans, as in _make_request
+        query = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
+        start_ns = time.perf_counter_ns()
+        try:
+            with self.auth.session.get(self._routes[method][0], params=query, stream=True) as response:
+                if response.status_code >= 400:
+                    DeribitAuth._handle_http_error(response)
+                response.raw.decode_content = True  # undo gzip before parsing
+                count = 0
+                has_result = False
+                for prefix, event, value in ijson.parse(response.raw):
+                    if prefix == "result.item" and event == "start_map":
+                        count += 1
+                    elif prefix == "" and event == "map_key" and value == "result":
+                        has_result = True
+            if not has_result:
+                raise Exception("API Error: no result in public/get_instruments response")
+        except Exception as e:
+            if self.logger is not None:
+                self._log_call(
+                    method,
+                    params,
+                    (time.perf_counter_ns() - start_ns) / 1_000_000,
+                    error=DeribitLogger.format_error(
+                        exception=e,
+                        http_status=getattr(getattr(e, "response", None), "status_code", None),
+                    ),
+                )
+            raise
+        self._log_call(
+            method, params, (time.perf_counter_ns() - start_ns) / 1_000_000, response={"count": count}
+        )
+        return count
 
     def get_order_book(self, instrument_name: str, depth: int = 10) -> Dict[str, Any]:
         """
@@ -331,21 +776,100 @@ class DeribitTrader:
             {"instrument_name": instrument_name, "depth": depth}
         )
 
+    def get_order_book_np(self, instrument_name: str, depth: int = 10) -> Dict[str, Any]:
+        """
+        Get order book with bids and asks as NumPy arrays
+
+        Same as get_order_book(), but "bids" and "asks" are float64 arrays
+        of shape (N, 2) holding [price, amount] rows, so book[:, 0] and
+        book[:, 1] give contiguous price and size columns for vectorized
+        analytics (requires: pip install numpy).
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+            depth: Order book depth
+
+        Returns:
+            Order book with bids and asks as arrays
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("get_order_book_np requires numpy: pip install numpy")
+
+        book = self.get_order_book(instrument_name, depth)
+        for side in ("bids", "asks"):
+            book[side] = np.asarray(book.get(side) or (), dtype=np.float64).reshape(-1, 2)
+        return book
+
     def get_ticker(self, instrument_name: str) -> Dict[str, Any]:
         """
         Get ticker data for an instrument
 
+        Concurrent calls for the same instrument share one request (and
+        the same result dict, which callers must not mutate).
+
         Args:
             instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
 
         Returns:
             Ticker data with current price, volume, etc.
         """
-        return self._make_request(
-            "public/ticker",
-            {"instrument_name": instrument_name}
+        return self._inflight.do(
+            ("public/ticker", instrument_name),
+            lambda: self._make_request("public/ticker", {"instrument_name": instrument_name}),
+        )
+
+    def make_ticker_fetcher(self, instrument_name: str) -> Callable[[], Dict[str, Any]]:
+        """
+        Build a fast ticker fetcher for high-rate polling loops
+
+        The query URL is encoded once up front, so each call is a bare GET
+        on the shared session. Calls bypass the logger and the WebSocket
+        transport; use get_ticker() where an audit trail is needed.
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+
+        Returns:
+            Zero-argument function returning the current ticker data
+        """
+        return self._make_fetcher(
+            f"{self._routes['public/ticker'][0]}?instrument_name={quote(instrument_name)}"
+        )
+
+    def make_order_book_fetcher(self, instrument_name: str, depth: int = 10) -> Callable[[], Dict[str, Any]]:
+        """
+        Build a fast order book fetcher for high-rate polling loops
+
+        Like make_ticker_fetcher(), calls bypass the logger and transport.
+
+        Args:
+            instrument_name: Instrument name (e.g., 'BTC-PERPETUAL')
+            depth: Order book depth
+
+        Returns:
+            Zero-argument function returning the current order book
+        """
+        return self._make_fetcher(
+            f"{self._routes['public/get_order_book'][0]}"
+            f"?instrument_name={quote(instrument_name)}&depth={int(depth)}"
         )
 
+    def _make_fetcher(self, url: str) -> Callable[[], Dict[str, Any]]:
+        """Return a closure that GETs a prebuilt public URL and unwraps the result"""
+        session = self.auth.session
+        handle_http_error = DeribitAuth._handle_http_error
+
+        def fetch() -> Dict[str, Any]:
+            response = session.get(url)
+            if response.status_code >= 400:
+                handle_http_error(response)
+            result = _json_loads(response.content)
+            if "result" in result:
+                return result["result"]
+            raise Exception(f"API Error: {result.get('error', result)}")
+
+        return fetch
+
     # =================================================================
     # TRADING - PLACING ORDERS
     # =================================================================
@@ -375,22 +899,10 @@ class DeribitTrader:
         Returns:
             Order details including order_id
         """
-        params: Dict[str, Any] = {
-            "instrument_name": instrument_name,
-            "amount": amount,
-            "type": order_type,
-        }
-
-        if price is not None:
-            params["price"] = price
-        if post_only:
-            params["post_only"] = True
-        if reduce_only:
-            params["reduce_only"] = True
-        if label:
-            params["label"] = label
-
-        return self._make_request("private/buy", params)
+        return self._make_request(
+            "private/buy",
+            _order_params(instrument_name, amount, order_type, price, post_only, reduce_only, label),
+        )
 
     def sell(
         self,
@@ -417,22 +929,10 @@ class DeribitTrader:
         Returns:
             Order details including order_id
         """
-        params: Dict[str, Any] = {
-            "instrument_name": instrument_name,
-            "amount": amount,
-            "type": order_type,
-        }
-
-        if price is not None:
-            params["price"] = price
-        if post_only:
-            params["post_only"] = True
-        if reduce_only:
-            params["reduce_only"] = True
-        if label:
-            params["label"] = label
-
-        return self._make_request("private/sell", params)
+        return self._make_request(
+            "private/sell",
+            _order_params(instrument_name, amount, order_type, price, post_only, reduce_only, label),
+        )
 
     # =================================================================
     # ORDER MANAGEMENT
@@ -620,132 +1120,160 @@ def main():
     # Initialize trader
     trader = DeribitTrader(auth)
 
-    # =================================================================
-    # EXAMPLE 1: Get Account Information
-    # =================================================================
-    print("\n[1] Account Summary")
-    print("-" * 70)
-    try:
-        summary = trader.get_account_summary(currency="BTC")
-        print(f"Currency: {summary.get('currency')}")
-        print(f"Balance: {summary.get('balance')} BTC")
-        print(f"Equity: {summary.get('equity')} BTC")
-        print(f"Available Funds: {summary.get('available_funds')} BTC")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # =================================================================
-    # EXAMPLE 2: Get Market Data
-    # =================================================================
-    print("\n[2] Market Data - BTC-PERPETUAL")
-    print("-" * 70)
-    try:
-        ticker = trader.get_ticker("BTC-PERPETUAL")
-        print(f"Last Price: ${ticker.get('last_price')}")
-        print(f"Mark Price: ${ticker.get('mark_price')}")
-        print(f"24h Volume: {ticker.get('stats', {}).get('volume')} BTC")
-        print(f"Bid: ${ticker.get('best_bid_price')}")
-        print(f"Ask: ${ticker.get('best_ask_price')}")
-    except Exception as e:
-        print(f"Error: {e}")
+    # Examples 1-6 are independent reads: fetch each with its own request,
+    # keeping a failed call's exception to print in its section below
+    reads = []
+    for fetch in (
+        lambda: trader.get_account_summary(currency="BTC"),
+        lambda: trader.get_ticker("BTC-PERPETUAL"),
+        lambda: trader.get_instruments(currency="BTC", kind="future"),
+        lambda: trader.get_order_book("BTC-PERPETUAL", depth=5),
+        lambda: trader.get_positions(currency="BTC"),
+        lambda: trader.get_open_orders(currency="BTC"),
+    ):
+        try:
+            reads.append(fetch())
+        except Exception as e:
+            reads.append(e)
+    summary, ticker, instruments, book, positions, orders = reads
+
+    # Everything below only formats the fetched data: build the report in
+    # memory and write it to the terminal in one go
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        # =================================================================
+        # EXAMPLE 1: Get Account Information
+        # =================================================================
+        print("\n[1] Account Summary")
+        print("-" * 70)
+        try:
+            if isinstance(summary, Exception):
+                raise summary
+            print(f"Currency: {summary.get('currency')}")
+            print(f"Balance: {summary.get('balance')} BTC")
+            print(f"Equity: {summary.get('equity')} BTC")
+            print(f"Available Funds: {summary.get('available_funds')} BTC")
+        except Exception as e:
+            print(f"Error: {e}")
 
-    # =================================================================
-    # EXAMPLE 3: Get Available Instruments
-    # =================================================================
-    print("\n[3] Available BTC Futures")
-    print("-" * 70)
-    try:
-        instruments = trader.get_instruments(currency="BTC", kind="future")
-        print(f"Found {len(instruments)} futures")
-        for inst in instruments[:5]:  # Show first 5
-            print(f"  - {inst['instrument_name']}")
-    except Exception as e:
-        print(f"Error: {e}")
+        # =================================================================
+        # EXAMPLE 2: Get Market Data
+        # =================================================================
+        print("\n[2] Market Data - BTC-PERPETUAL")
+        print("-" * 70)
+        try:
+            if isinstance(ticker, Exception):
+                raise ticker
+            print(f"Last Price: ${ticker.get('last_price')}")
+            print(f"Mark Price: ${ticker.get('mark_price')}")
+            print(f"24h Volume: {ticker.get('stats', {}).get('volume')} BTC")
+            print(f"Bid: ${ticker.get('best_bid_price')}")
+            print(f"Ask: ${ticker.get('best_ask_price')}")
+        except Exception as e:
+            print(f"Error: {e}")
 
-    # =================================================================
-    # EXAMPLE 4: Get Order Book
-    # =================================================================
-    print("\n[4] Order Book - BTC-PERPETUAL (Top 5)")
-    print("-" * 70)
-    try:
-        book = trader.get_order_book("BTC-PERPETUAL", depth=5)
-        print("Asks (Sell Orders):")
-        for ask in book.get('asks', [])[:5]:
-            print(f"  ${ask[0]} x {ask[1]} contracts")
-        print("\nBids (Buy Orders):")
-        for bid in book.get('bids', [])[:5]:
-            print(f"  ${bid[0]} x {bid[1]} contracts")
-    except Exception as e:
-        print(f"Error: {e}")
+        # =================================================================
+        # EXAMPLE 3: Get Available Instruments
+        # =================================================================
+        print("\n[3] Available BTC Futures")
+        print("-" * 70)
+        try:
+            if isinstance(instruments, Exception):
+                raise instruments
+            print(f"Found {len(instruments)} futures")
+            for inst in instruments[:5]:  # Show first 5
+                print(f"  - {inst['instrument_name']}")
+        except Exception as e:
+            print(f"Error: {e}")
 
-    # =================================================================
-    # EXAMPLE 5: Get Positions
-    # =================================================================
-    print("\n[5] Current Positions")
-    print("-" * 70)
-    try:
-        positions = trader.get_positions(currency="BTC")
-        if positions:
-            for pos in positions:
-                print(f"Instrument: {pos['instrument_name']}")
-                print(f"  Size: {pos.get('size')} contracts")
-                print(f"  Direction: {pos.get('direction')}")
-                print(f"  Average Price: ${pos.get('average_price')}")
-                print(f"  P&L: {pos.get('total_profit_loss')} BTC")
-                print()
-        else:
-            print("No open positions")
-    except Exception as e:
-        print(f"Error: {e}")
+        # =================================================================
+        # EXAMPLE 4: Get Order Book
+        # =================================================================
+        print("\n[4] Order Book - BTC-PERPETUAL (Top 5)")
+        print("-" * 70)
+        try:
+            if isinstance(book, Exception):
+                raise book
+            print("Asks (Sell Orders):")
+            for price, amount in book.get('asks', [])[:5]:
+                print(f"  ${price} x {amount} contracts")
+            print("\nBids (Buy Orders):")
+            for price, amount in book.get('bids', [])[:5]:
+                print(f"  ${price} x {amount} contracts")
+        except Exception as e:
+            print(f"Error: {e}")
 
-    # =================================================================
-    # EXAMPLE 6: Get Open Orders
-    # =================================================================
-    print("\n[6] Open Orders")
-    print("-" * 70)
-    try:
-        orders = trader.get_open_orders(currency="BTC")
-        if orders:
-            for order in orders:
-                print(f"Order ID: {order['order_id']}")
-                print(f"  Instrument: {order['instrument_name']}")
-                print(f"  Direction: {order['direction']}")
-                print(f"  Amount: {order['amount']} contracts")
-                print(f"  Price: ${order.get('price', 'Market')}")
-                print(f"  Status: {order['order_state']}")
-                print()
-        else:
-            print("No open orders")
-    except Exception as e:
-        print(f"Error: {e}")
+        # =================================================================
+        # EXAMPLE 5: Get Positions
+        # =================================================================
+        print("\n[5] Current Positions")
+        print("-" * 70)
+        try:
+            if isinstance(positions, Exception):
+                raise positions
+            if positions:
+                for pos in positions:
+                    print(f"Instrument: {pos['instrument_name']}")
+                    print(f"  Size: {pos.get('size')} contracts")
+                    print(f"  Direction: {pos.get('direction')}")
+                    print(f"  Average Price: ${pos.get('average_price')}")
+                    print(f"  P&L: {pos.get('total_profit_loss')} BTC")
+                    print()
+            else:
+                print("No open positions")
+        except Exception as e:
+            print(f"Error: {e}")
 
-    # =================================================================
-    # EXAMPLE 7: PLACE ORDER (Commented out for safety)
-    # =================================================================
-    print("\n[7] Place Order Example (COMMENTED OUT)")
-    print("-" * 70)
-    print("# Uncomment to test placing orders:")
-    print("#")
-    print("# # Place a limit buy order")
-    print("# order = trader.buy(")
-    print("#     instrument_name='BTC-PERPETUAL',")
-    print("#     amount=10,")
-    print("#     order_type='limit',")
-    print("#     price=50000,")
-    print("#     post_only=True,")
-    print("#     label='demo_order'")
-    print("# )")
-    print("# print(f\"Order placed: {order['order_id']}\")")
-    print("#")
-    print("# # Cancel the order")
-    print("# trader.cancel_order(order['order_id'])")
-    print("# print(\"Order cancelled\")")
-
-    print("\n" + "=" * 70)
-    print("Demo completed!")
-    if logger:
-        print(f"Logs written to: {logger.log_dir}")
-    print("=" * 70)
+        # =================================================================
+        # EXAMPLE 6: Get Open Orders
+        # =================================================================
+        print("\n[6] Open Orders")
+        print("-" * 70)
+        try:
+            if isinstance(orders, Exception):
+                raise orders
+            if orders:
+                for order in orders:
+                    print(f"Order ID: {order['order_id']}")
+                    print(f"  Instrument: {order['instrument_name']}")
+                    print(f"  Direction: {order['direction']}")
+                    print(f"  Amount: {order['amount']} contracts")
+                    print(f"  Price: ${order.get('price', 'Market')}")
+                    print(f"  Status: {order['order_state']}")
+                    print()
+            else:
+                print("No open orders")
+        except Exception as e:
+            print(f"Error: {e}")
+
+        # =================================================================
+        # EXAMPLE 7: PLACE ORDER (Commented out for safety)
+        # =================================================================
+        print("\n[7] Place Order Example (COMMENTED OUT)")
+        print("-" * 70)
+        print("# Uncomment to test placing orders:")
+        print("#")
+        print("# # Place a limit buy order")
+        print("# order = trader.buy(")
+        print("#     instrument_name='BTC-PERPETUAL',")
+        print("#     amount=10,")
+        print("#     order_type='limit',")
+        print("#     price=50000,")
+        print("#     post_only=True,")
+        print("#     label='demo_order'")
+        print("# )")
+        print("# print(f\"Order placed: {order['order_id']}\")")
+        print("#")
+        print("# # Cancel the order")
+        print("# trader.cancel_order(order['order_id'])")
+        print("# print(\"Order cancelled\")")
+
+        print("\n" + "=" * 70)
+        print("Demo completed!")
+        if logger:
+            print(f"Logs written to: {logger.log_dir}")
+        print("=" * 70)
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,550 @@
+"""
+Deribit WebSocket Authentication Module
+
+Authenticates over Deribit's WebSocket JSON-RPC API and multiplexes any
+number of public/private calls over that single persistent connection.
+Each request gets an incrementing id and responses are matched back to
+their callers, so many calls can be in flight at once without paying a
+new HTTP round-trip (and TLS record set) per call.
+
+DeribitWSAuth is the asyncio API; DeribitWSTransport is a thread-based
+equivalent that DeribitTrader can send its calls through instead of
+one HTTPS request per call.
+
+Requires the optional `websockets` package:
+    pip install websockets
+
+Author: API Developer
+Environment: Deribit Test (test.deribit.com)
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from deribit_auth import DeribitAuth, _json_dumps, _json_loads
+
+# Try to import websockets (optional)
+try:
+    import websockets
+    from websockets.sync.client import connect as ws_connect
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+# Try to import logger (optional)
+try:
+    from deribit_logger import DeribitLogger
+    LOGGER_AVAILABLE = True
+except ImportError:
+    LOGGER_AVAILABLE = False
+
+
+class DeribitWSAuth:
+    """
+    Deribit WebSocket Authentication Handler
+
+    Mirrors the DeribitAuth API with async methods:
+    - Client Credentials
+    - Client Signature (HMAC-SHA256)
+    - Refresh Token
+
+    Once authenticated, the WebSocket connection itself is authorized, so
+    private methods sent through call() need no access token.
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        test_mode: bool = True,
+        credentials_file: Optional[str] = None,
+        logger: Optional["DeribitLogger"] = None,
+    ):
+        """
+        Initialize Deribit WebSocket Authentication
+
+        Credentials are resolved exactly like DeribitAuth (parameters,
+        credentials.json, environment variables, .env file).
+
+        Args:
+            client_id: Your Deribit API Client ID (optional if using other methods)
+            client_secret: Your Deribit API Client Secret (optional if using other methods)
+            test_mode: Use test environment (default: True)
+            credentials_file: Custom path to credentials JSON file
+            logger: Optional DeribitLogger instance for audit logging
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError(
+                "DeribitWSAuth requires the 'websockets' package: pip install websockets"
+            )
+
+        # Reuse DeribitAuth for credential discovery and HMAC signing
+        self._auth = DeribitAuth(
+            client_id=client_id,
+            client_secret=client_secret,
+            test_mode=test_mode,
+            credentials_file=credentials_file,
+            logger=logger,
+        )
+        self.logger = logger
+        self.client_id = self._auth.client_id
+        self.test_mode = test_mode
+        self.base_url = self._auth.base_url
+        self.ws_url = "wss://test.deribit.com/ws/api/v2" if test_mode else "wss://www.deribit.com/ws/api/v2"
+        self._environment = self._auth._environment
+        self._credentials_source = self._auth._credentials_source
+
+        self.access_token = None
+        self.refresh_token = None
+        self.token_expiry = None  # time.monotonic() deadline
+        self.scope = None
+
+        self._ws = None
+        self._reader_task = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    # =================================================================
+    # CONNECTION
+    # =================================================================
+
+    async def connect(self) -> None:
+        """Open the WebSocket connection and start the response reader"""
+        if self._ws is not None:
+            return
+        self._ws = await websockets.connect(self.ws_url)
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def close(self) -> None:
+        """Close the WebSocket connection and fail any pending calls"""
+        if self._ws is None:
+            return
+        await self._ws.close()
+        if self._reader_task:
+            await self._reader_task
+        self._ws = None
+        self._reader_task = None
+
+    async def __aenter__(self) -> "DeribitWSAuth":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _read_loop(self) -> None:
+        """Route each incoming message to the future waiting on its id"""
+        try:
+            async for message in self._ws:
+                result = _json_loads(message)
+                future = self._pending.pop(result.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket connection closed"))
+            self._pending.clear()
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request over the shared connection
+
+        Calls may be issued concurrently (e.g. with asyncio.gather); each
+        one waits only for its own response.
+
+        Args:
+            method: API method name (e.g., 'public/ticker')
+            params: Request parameters
+
+        Returns:
+            API response result
+        """
+        await self.connect()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # Decoded to str so it goes out as a text frame
+            await self._ws.send(_json_dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params or {},
+            }).decode())
+            result = await future
+        finally:
+            # Already popped by the reader on success; this covers a failed
+            # send (e.g. closed socket) or a cancelled call
+            self._pending.pop(request_id, None)
+
+        if "result" in result:
+            return result["result"]
+        raise Exception(f"API Error: {result.get('error', result)}")
+
+    # =================================================================
+    # AUTHENTICATION
+    # =================================================================
+
+    async def _auth_request(
+        self,
+        params: Dict[str, Any],
+        event: str,
+        method: str,
+        scope: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send public/auth over the WebSocket and store the issued tokens"""
+        start_ns = time.perf_counter_ns()
+        try:
+            result = await self.call("public/auth", params)
+        except Exception as e:
+            if self.logger:
+                self.logger.log_auth(
+                    event="auth_failure" if event != "token_refresh" else event,
+                    client_id=self.client_id,
+                    method=method,
+                    scope_requested=scope,
+                    credentials_source=self._credentials_source,
+                    status="error",
+                    latency_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+                    error=DeribitLogger.format_error(exception=e),
+                    environment=self._environment,
+                    base_url=self.ws_url,
+                    api_method="public/auth",
+                )
+            raise
+
+        self.access_token = result["access_token"]
+        self.refresh_token = result["refresh_token"]
+        self.token_expiry = time.monotonic() + result["expires_in"]
+        self.scope = result.get("scope")
+
+        if self.logger:
+            self.logger.log_auth(
+                event=event,
+                client_id=self.client_id,
+                method=method,
+                scope_requested=scope,
+                scope_granted=self.scope,
+                token_expires_in=result["expires_in"],
+                access_token=self.access_token,
+                credentials_source=self._credentials_source,
+                status="success",
+                latency_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+                environment=self._environment,
+                base_url=self.ws_url,
+                api_method="public/auth",
+            )
+
+        return result
+
+    async def authenticate_credentials(self, scope: str = "session:default") -> Dict[str, Any]:
+        """
+        Authenticate the connection using Client Credentials
+
+        Args:
+            scope: Access scope (default: "session:default")
+
+        Returns:
+            Authentication response with access_token and refresh_token
+        """
+        params = {
+            "grant_type": "client_credentials",
+            "client_id": self._auth.client_id,
+            "client_secret": self._auth.client_secret,
+            "scope": scope
+        }
+        return await self._auth_request(params, "auth_credentials", "client_credentials", scope)
+
+    async def authenticate_signature(self, scope: str = "session:default", data: str = "") -> Dict[str, Any]:
+        """
+        Authenticate the connection using Client Signature (HMAC-SHA256)
+
+        Args:
+            scope: Access scope
+            data: Optional data field for signature
+
+        Returns:
+            Authentication response with access_token and refresh_token
+        """
+        timestamp = time.time_ns() // 1_000_000  # milliseconds
+        nonce = self._auth._generate_nonce()
+        params = {
+            "grant_type": "client_signature",
+            "client_id": self._auth.client_id,
+            "timestamp": timestamp,
+            "nonce": nonce,
+            "data": data,
+            "signature": self._auth._calculate_signature(timestamp, nonce, data),
+            "scope": scope
+        }
+        return await self._auth_request(params, "auth_signature", "client_signature", scope)
+
+    async def refresh_access_token(self) -> Dict[str, Any]:
+        """
+        Refresh the access token using refresh_token
+
+        Returns:
+            New authentication response with fresh tokens
+        """
+        if not self.refresh_token:
+            raise Exception("No refresh token available. Authenticate first.")
+
+        params = {
+            "grant_type": "refresh_token",
+            "refresh_token": self.refresh_token
+        }
+        return await self._auth_request(params, "token_refresh", "refresh_token")
+
+    def is_token_valid(self, buffer_seconds: int = 60) -> bool:
+        """
+        Check if current access token is still valid
+
+        Args:
+            buffer_seconds: Treat token as expired this many seconds early
+
+        Returns:
+            True if token is valid and not expiring soon
+        """
+        if not self.access_token or not self.token_expiry:
+            return False
+
+        return time.monotonic() < (self.token_expiry - buffer_seconds)
+
+
+class DeribitWSTransport:
+    """
+    Synchronous Deribit WebSocket Transport
+
+    Keeps one WebSocket open and sends JSON-RPC requests over it from any
+    thread; a background reader thread resolves each caller's Future by
+    response id, so many requests can be in flight at once. Private
+    methods are sent on a connection authorized once with public/auth
+    (client signature), re-authorized shortly before the token expires.
+
+    Pass it to DeribitTrader(auth, transport=...) to route the trader's
+    calls over the socket instead of HTTPS.
+    """
+
+    def __init__(self, auth: DeribitAuth, timeout: float = 10.0, retry_interval: float = 5.0):
+        """
+        Initialize the transport (the connection is opened on first use)
+
+        Args:
+            auth: DeribitAuth instance providing credentials and logger
+            timeout: Seconds to wait for each response
+            retry_interval: After a failed connect, seconds before trying again
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError(
+                "DeribitWSTransport requires the 'websockets' package: pip install websockets"
+            )
+
+        self.auth = auth
+        self.logger = getattr(auth, "logger", None)
+        self.ws_url = "wss://test.deribit.com/ws/api/v2" if auth.test_mode else "wss://www.deribit.com/ws/api/v2"
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+
+        self._ws = None
+        self._reader = None
+        self._pending: Dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+        self._retry_at = 0.0  # time.monotonic() before which connect() fails fast
+        self._token_expiry = None  # time.monotonic() deadline of the connection's auth
+
+    # =================================================================
+    # CONNECTION
+    # =================================================================
+
+    def connect(self) -> None:
+        """
+        Open the WebSocket connection and start the reader thread
+
+        Raises ConnectionError right away while a previous attempt failed
+        less than retry_interval seconds ago.
+        """
+        with self._connect_lock:
+            if self._ws is not None:
+                return
+            if time.monotonic() < self._retry_at:
+                raise ConnectionError("WebSocket unavailable (waiting to retry)")
+            try:
+                ws = ws_connect(self.ws_url, open_timeout=self.timeout)
+            except Exception:
+                self._retry_at = time.monotonic() + self.retry_interval
+                raise
+            self._ws = ws
+            self._token_expiry = None
+            self._reader = threading.Thread(target=self._read_loop, args=(ws,), daemon=True)
+            self._reader.start()
+
+    def close(self) -> None:
+        """Close the WebSocket connection and fail any pending requests"""
+        with self._connect_lock:
+            ws, reader = self._ws, self._reader
+            self._ws = None
+            self._reader = None
+        if ws is not None:
+            ws.close()
+        if reader is not None:
+            reader.join(self.timeout)
+
+    def __enter__(self) -> "DeribitWSTransport":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_loop(self, ws) -> None:
+        """Route each incoming message to the Future waiting on its id"""
+        try:
+            for message in ws:
+                result = _json_loads(message)
+                future = self._pending.pop(result.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            with self._connect_lock:
+                if self._ws is ws:
+                    self._ws = None
+                    self._reader = None
+            for request_id in list(self._pending):
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_exception(ConnectionError("WebSocket connection closed"))
+
+    def _send(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one JSON-RPC request and block for its raw response message"""
+        ws = self._ws
+        if ws is None:
+            raise ConnectionError("WebSocket is not connected")
+
+        request_id = next(self._ids)
+        future = Future()
+        self._pending[request_id] = future
+        try:
+            # Decoded to str so it goes out as a text frame
+            ws.send(_json_dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params,
+            }).decode())
+            return future.result(self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    # =================================================================
+    # REQUESTS
+    # =================================================================
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Send a request and return the raw JSON-RPC response message
+
+        Args:
+            method: API method name (e.g., 'public/ticker')
+            params: Request parameters
+
+        Returns:
+            Response message containing either "result" or "error"
+        """
+        self.connect()
+        if method.startswith("private/"):
+            self._ensure_authorized()
+        return self._send(method, params or {})
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a request and return its result
+
+        Args:
+            method: API method name (e.g., 'public/ticker')
+            params: Request parameters
+
+        Returns:
+            API response result
+        """
+        result = self.request(method, params)
+        if "result" in result:
+            return result["result"]
+        raise Exception(f"API Error: {result.get('error', result)}")
+
+    def _ensure_authorized(self, buffer_seconds: int = 60) -> None:
+        """Authorize the connection with public/auth unless it still is"""
+        with self._auth_lock:
+            if self._token_expiry is not None and time.monotonic() < self._token_expiry - buffer_seconds:
+                return
+
+            auth = self.auth
+            timestamp = time.time_ns() // 1_000_000  # milliseconds
+            nonce = auth._generate_nonce()
+            params = {
+                "grant_type": "client_signature",
+                "client_id": auth.client_id,
+                "timestamp": timestamp,
+                "nonce": nonce,
+                "data": "",
+                "signature": auth._calculate_signature(timestamp, nonce, ""),
+            }
+
+            start_ns = time.perf_counter_ns()
+            error = None
+            try:
+                result = self._send("public/auth", params)
+                if "result" not in result:
+                    error = Exception(f"API Error: {result.get('error', result)}")
+            except Exception as e:
+                error = e
+
+            if self.logger:
+                self.logger.log_auth(
+                    event="auth_failure" if error else "auth_signature",
+                    client_id=auth.client_id,
+                    method="client_signature",
+                    credentials_source=auth._credentials_source,
+                    status="error" if error else "success",
+                    latency_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+                    error=DeribitLogger.format_error(exception=error) if error else None,
+                    environment=auth._environment,
+                    base_url=self.ws_url,
+                    api_method="public/auth",
+                )
+            if error:
+                raise error
+
+            self._token_expiry = time.monotonic() + result["result"]["expires_in"]
+
+
+async def main():
+    """
+    Example usage of DeribitWSAuth
+    """
+    async with DeribitWSAuth(test_mode=True) as ws:
+        await ws.authenticate_credentials(scope="trade:read_write session:ws_demo")
+        print(f"Authenticated over WebSocket (scope: {ws.scope})")
+
+        # Both requests are in flight on the same connection at once
+        summary, ticker = await asyncio.gather(
+            ws.call("private/get_account_summary", {"currency": "BTC"}),
+            ws.call("public/ticker", {"instrument_name": "BTC-PERPETUAL"}),
+        )
+        print(f"Balance: {summary.get('balance')} BTC")
+        print(f"BTC-PERPETUAL Last Price: {ticker.get('last_price')}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,13 +3,46 @@ Simple Example Script - Deribit Test API
 
 This script demonstrates basic authentication and market data retrieval.
 Safe to run - only reads data, doesn't place any orders.
+
+The four reads after authentication are independent, so they are issued
+concurrently with asyncio.gather (on a pooled httpx client when httpx is
+installed, otherwise on worker threads).
 """
 
+import asyncio
+import functools
+
 from deribit_auth import DeribitAuth
 from deribit_trader import DeribitTrader
+from deribit_async_trader import AsyncDeribitTrader, HTTPX_AVAILABLE
 
 
-def main():
+async def fetch_overview(auth: DeribitAuth) -> list:
+    """Fetch balance, price, futures and positions in parallel"""
+    if HTTPX_AVAILABLE:
+        async with AsyncDeribitTrader(auth) as trader:
+            return await asyncio.gather(
+                trader.get_account_summary(currency="BTC"),
+                trader.get_ticker("BTC-PERPETUAL"),
+                trader.get_instruments(currency="BTC", kind="future"),
+                trader.get_positions(currency="BTC"),
+                return_exceptions=True,
+            )
+
+    # Without httpx, run the blocking calls on worker threads instead
+    # (run_in_executor rather than asyncio.to_thread, which needs 3.9+)
+    trader = DeribitTrader(auth)
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, functools.partial(trader.get_account_summary, currency="BTC")),
+        loop.run_in_executor(None, functools.partial(trader.get_ticker, "BTC-PERPETUAL")),
+        loop.run_in_executor(None, functools.partial(trader.get_instruments, currency="BTC", kind="future")),
+        loop.run_in_executor(None, functools.partial(trader.get_positions, currency="BTC")),
+        return_exceptions=True,
+    )
+
+
+async def main():
     print("=" * 70)
     print("Simple Deribit Test API Example")
     print("=" * 70)
@@ -32,14 +65,15 @@ def main():
         print(f"Authentication failed: {e}")
         return
 
-    # Step 2: Initialize trader
-    trader = DeribitTrader(auth)
+    # Step 2: Fetch everything at once
+    summary, ticker, instruments, positions = await fetch_overview(auth)
 
     # Step 3: Get account balance
     print("Step 2: Getting Account Balance...")
     print("-" * 70)
     try:
-        summary = trader.get_account_summary(currency="BTC")
+        if isinstance(summary, Exception):
+            raise summary
         balance = summary.get('balance', 0)
         equity = summary.get('equity', 0)
         print(f"Balance: {balance} BTC")
@@ -51,7 +85,8 @@ def main():
     print("Step 3: Getting BTC-PERPETUAL Market Price...")
     print("-" * 70)
     try:
-        ticker = trader.get_ticker("BTC-PERPETUAL")
+        if isinstance(ticker, Exception):
+            raise ticker
         last_price = ticker.get('last_price')
         mark_price = ticker.get('mark_price')
         volume_24h = ticker.get('stats', {}).get('volume', 0)
@@ -66,7 +101,8 @@ def main():
     print("Step 4: Getting Top 3 BTC Futures...")
     print("-" * 70)
     try:
-        instruments = trader.get_instruments(currency="BTC", kind="future")
+        if isinstance(instruments, Exception):
+            raise instruments
         for i, inst in enumerate(instruments[:3], 1):
             name = inst['instrument_name']
             print(f"{i}. {name}")
@@ -78,7 +114,8 @@ def main():
     print("Step 5: Checking Open Positions...")
     print("-" * 70)
     try:
-        positions = trader.get_positions(currency="BTC")
+        if isinstance(positions, Exception):
+            raise positions
         if positions:
             print(f"You have {len(positions)} open position(s):")
             for pos in positions:
@@ -99,4 +136,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())